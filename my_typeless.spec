@@ -29,7 +29,9 @@ a = Analysis(
         "my_typeless",
         "my_typeless.config",
         "my_typeless.history",
+        "my_typeless.jsonio",
         "my_typeless.hotkey",
+        "my_typeless.api_clients",
         "my_typeless.llm_client",
         "my_typeless.recorder",
         "my_typeless.stt_client",
@@ -39,11 +41,6 @@ a = Analysis(
         "my_typeless.version",
         "my_typeless._version",  # 由 scripts/build.py 在打包前生成；version.py 通过 try-import 引用
         "my_typeless.updater",
-        # PyQt6 相关
-        "PyQt6.QtCore",
-        "PyQt6.QtGui",
-        "PyQt6.QtWidgets",
-        "PyQt6.sip",
         # pyaudio 底层依赖
         "pyaudio",
         "_portaudio",
@@ -63,6 +60,12 @@ a = Analysis(
         "pandas",
         "scipy",
         "pytest",
+        # UI 已迁移到 pywebview + pystray，避免构建环境中的 Qt 被 pywebview 的可选后端带入
+        "PyQt5",
+        "PyQt6",
+        "PySide2",
+        "PySide6",
+        "qtpy",
     ],
     noarchive=False,
     optimize=1,
@@ -23,10 +23,49 @@ BUILD_VERSION_FILE = ROOT / "src" / "my_typeless" / "_version.py"
 SPEC_FILE = ROOT / "my_typeless.spec"
 VERSION_INFO_FILE = ROOT / "file_version_info.txt"
 RESOURCES_DIR = ROOT / "src" / "my_typeless" / "resources"
+PYI_CACHE_DIR = ROOT / ".pyi_cache"  # PyInstaller 缓存（PYINSTALLER_CONFIG_DIR），不入库
 
 DEV_VERSION = "0.0.0.dev0"
 ENV_VERSION_KEY = "MY_TYPELESS_VERSION"
 
+_BUILD_VERSION_RE = re.compile(r'^__version__\s*=\s*"([^"]+)"', re.MULTILINE)
+# 版本号中预发布/本地标识（- 或 + 之后）的分隔符
+_VERSION_SUFFIX_SEP_RE = re.compile(r"[-+]")
+
+# Windows 版本资源模板（PyInstaller version= 参数使用）
+_VERSION_INFO_TEMPLATE = """\
+# UTF-8
+VSVersionInfo(
+  ffi=FixedFileInfo(
+    filevers=({major}, {minor}, {patch}, {build}),
+    prodvers=({major}, {minor}, {patch}, {build}),
+    mask=0x3f,
+    flags=0x0,
+    OS=0x40004,
+    fileType=0x1,
+    subtype=0x0,
+    date=(0, 0),
+  ),
+  kids=[
+    StringFileInfo([
+      StringTable(
+        '040904B0',
+        [
+          StringStruct('CompanyName', 'xbghc'),
+          StringStruct('FileDescription', 'My Typeless - AI Voice Dictation'),
+          StringStruct('FileVersion', '{version}'),
+          StringStruct('InternalName', 'MyTypeless'),
+          StringStruct('OriginalFilename', 'MyTypeless.exe'),
+          StringStruct('ProductName', 'My Typeless'),
+          StringStruct('ProductVersion', '{version}'),
+        ],
+      )
+    ]),
+    VarFileInfo([VarStruct('Translation', [0x0409, 1200])])
+  ],
+)
+"""
+
 
 def _normalize_version(version: str) -> str:
     """去掉可能的 'v'/'V' 前缀，兼容 'v1.2.3' 与 '1.2.3' 两种写法"""
@@ -38,8 +77,24 @@ def _normalize_version(version: str) -> str:
     return normalized
 
 
+def read_build_version() -> str | None:
+    """读取 _version.py 中已注入的版本；文件不存在或格式不符时返回 None
+
+    用正则匹配而非 import/exec，避免为取一个字符串执行整个模块。
+    """
+    try:
+        text = BUILD_VERSION_FILE.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    match = _BUILD_VERSION_RE.search(text)
+    return match.group(1) if match else None
+
+
 def write_build_version(version: str) -> None:
     """生成 _version.py 注入实际版本（CI/构建流程使用，源树 version.py 不变）"""
+    if read_build_version() == version:
+        print(f"[build] {BUILD_VERSION_FILE.name} already at {version}, skipped")
+        return
     BUILD_VERSION_FILE.write_text(
         '"""Auto-generated by scripts/build.py at build time — do not edit, do not commit."""\n\n'
         f'__version__ = "{version}"\n',
@@ -51,7 +106,7 @@ def write_build_version(version: str) -> None:
 def generate_version_info(version: str) -> None:
     """生成 Windows 版本信息文件"""
     version = _normalize_version(version)
-    base_version = re.split(r"[-+]", version, maxsplit=1)[0]
+    base_version = _VERSION_SUFFIX_SEP_RE.split(version, maxsplit=1)[0]
     # 取前导的数字段（兼容 PEP 440 的 .dev0/.a1/.rc1 等后缀）
     parts: list[int] = []
     for seg in base_version.split("."):
@@ -62,38 +117,15 @@ def generate_version_info(version: str) -> None:
         parts.append(0)
     major, minor, patch, build = parts[:4]
 
-    info = f"""\
-# UTF-8
-VSVersionInfo(
-  ffi=FixedFileInfo(
-    filevers=({major}, {minor}, {patch}, {build}),
-    prodvers=({major}, {minor}, {patch}, {build}),
-    mask=0x3f,
-    flags=0x0,
-    OS=0x40004,
-    fileType=0x1,
-    subtype=0x0,
-    date=(0, 0),
-  ),
-  kids=[
-    StringFileInfo([
-      StringTable(
-        '040904B0',
-        [
-          StringStruct('CompanyName', 'xbghc'),
-          StringStruct('FileDescription', 'My Typeless - AI Voice Dictation'),
-          StringStruct('FileVersion', '{version}'),
-          StringStruct('InternalName', 'MyTypeless'),
-          StringStruct('OriginalFilename', 'MyTypeless.exe'),
-          StringStruct('ProductName', 'My Typeless'),
-          StringStruct('ProductVersion', '{version}'),
-        ],
-      )
-    ]),
-    VarFileInfo([VarStruct('Translation', [0x0409, 1200])])
-  ],
-)
-"""
+    info = _VERSION_INFO_TEMPLATE.format(
+        major=major, minor=minor, patch=patch, build=build, version=version
+    )
+    try:
+        if VERSION_INFO_FILE.read_text(encoding="utf-8") == info:
+            print(f"[build] Version info file unchanged: {VERSION_INFO_FILE}")
+            return
+    except FileNotFoundError:
+        pass
     VERSION_INFO_FILE.write_text(info, encoding="utf-8")
     print(f"[build] Version info file generated: {VERSION_INFO_FILE}")
 
@@ -116,8 +148,11 @@ def generate_ico() -> None:
 def generate_tray_pngs() -> None:
     """从 SVG 生成托盘图标 PNG（pystray 使用 Pillow Image，需要 PNG 格式）"""
     tray_icons = ["icon_idle", "icon_recording", "icon_processing"]
+    sys.path.insert(0, str(ROOT / "src"))
+    from my_typeless.icon_builder import render_svg_png
+
     try:
-        import resvg_py
+        import resvg_py  # noqa: F401  # 仅探测可用性，实际渲染由 render_svg_png 完成
     except ImportError:
         # 检查 PNG 是否已存在
         all_exist = all((RESOURCES_DIR / f"{name}.png").exists() for name in tray_icons)
@@ -134,24 +169,33 @@ def generate_tray_pngs() -> None:
         if not svg_path.exists():
             print(f"[build] SVG not found: {svg_path}, skipping")
             continue
-        png_data = bytes(resvg_py.svg_to_bytes(svg_path=str(svg_path), width=size, height=size))
-        png_path.write_bytes(png_data)
+        png_path.write_bytes(render_svg_png(size, svg_path=str(svg_path)))
 
     print(f"[build] Tray PNGs generated: {', '.join(tray_icons)}")
 
 
-def run_pyinstaller() -> None:
-    """执行 PyInstaller 构建"""
+def run_pyinstaller(clean: bool = False) -> None:
+    """执行 PyInstaller 构建
+
+    默认不传 --clean，复用上次构建留在 .pyi_cache/ 与 build/ 中的缓存；
+    依赖或 hook 变化导致缓存异常时用 --clean 完整重建（CI 直接调用 pyinstaller --clean）。
+    """
     cmd = [
         sys.executable,
         "-m",
         "PyInstaller",
         str(SPEC_FILE),
-        "--clean",
         "--noconfirm",
+        "--log-level",
+        "WARN",
     ]
+    if clean:
+        cmd.append("--clean")
+    # 字节码优化级别已由 spec 中 optimize=1 控制（等效 -O）；
+    # 使用项目内独立的 PyInstaller 缓存目录，避免与其他项目/并发构建争用全局缓存锁
+    env = {**os.environ, "PYINSTALLER_CONFIG_DIR": str(PYI_CACHE_DIR)}
     print(f"[build] Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, cwd=str(ROOT))
+    result = subprocess.run(cmd, cwd=str(ROOT), env=env)
     if result.returncode != 0:
         print("[build] PyInstaller build failed!", file=sys.stderr)
         sys.exit(1)
@@ -181,6 +225,11 @@ def main():
         action="store_true",
         help="Only prepare version + assets, skip PyInstaller build",
     )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Clear the PyInstaller cache before building (default: reuse it)",
+    )
     args = parser.parse_args()
 
     version, source = resolve_version(args.version)
@@ -195,7 +244,7 @@ def main():
     generate_tray_pngs()
 
     if not args.no_build:
-        run_pyinstaller()
+        run_pyinstaller(clean=args.clean)
 
 
 if __name__ == "__main__":
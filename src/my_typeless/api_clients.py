@@ -0,0 +1,64 @@
+"""API 客户端复用 - 按 (base_url, api_key) 缓存 SDK 客户端
+
+每次听写都会新建 STT/LLM 客户端；SDK 客户端各自持有 httpx 连接池，
+复用同一实例可保留已建立的 TCP/TLS 连接，省去每次请求前的握手。
+在设置中只更换 API Key（base_url 不变）时，新客户端经 with_options 派生，
+与旧客户端共用同一个 httpx 连接池，同样无需重新握手。
+
+openai/anthropic 导入时会连带加载 httpx、pydantic 等，耗时可达数百毫秒；
+推迟到首次创建客户端时再导入，不拖慢启动。
+"""
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+    from openai import OpenAI
+
+_lock = threading.Lock()
+_openai_clients: dict[tuple[str, str], "OpenAI"] = {}
+_anthropic_clients: dict[tuple[str, str], "Anthropic"] = {}
+
+
+def _derive_client(clients: dict, base_url: str, api_key: str):
+    """同一 base_url 已有客户端时派生出仅 API Key 不同的副本（共享连接池），否则返回 None。
+
+    SDK 的 copy() 会把空 api_key 视为"沿用原值"，因此空 Key 不走派生。调用方需持有锁。
+    """
+    if not api_key:
+        return None
+    for (url, _), client in clients.items():
+        if url == base_url:
+            return client.with_options(api_key=api_key)
+    return None
+
+
+def get_openai_client(base_url: str, api_key: str) -> "OpenAI":
+    """返回共享的 OpenAI 兼容客户端（STT 与 LLM 同一服务商时也共用连接）"""
+    key = (base_url, api_key)
+    with _lock:
+        client = _openai_clients.get(key)
+        if client is None:
+            client = _derive_client(_openai_clients, base_url, api_key)
+            if client is None:
+                from openai import OpenAI
+
+                client = OpenAI(base_url=base_url, api_key=api_key)
+            _openai_clients[key] = client
+    return client
+
+
+def get_anthropic_client(base_url: str, api_key: str) -> "Anthropic":
+    """返回共享的 Anthropic 客户端；base_url 为空时使用 SDK 默认地址"""
+    key = (base_url, api_key)
+    with _lock:
+        client = _anthropic_clients.get(key)
+        if client is None:
+            client = _derive_client(_anthropic_clients, base_url, api_key)
+            if client is None:
+                from anthropic import Anthropic
+
+                client = Anthropic(api_key=api_key, base_url=base_url if base_url else None)
+            _anthropic_clients[key] = client
+    return client
@@ -1,10 +1,11 @@
 """配置管理模块 - 读写 JSON 配置文件"""
 
-import json
 import os
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
+from my_typeless import jsonio
+
 # 开发模式：每次启动强制使用代码中的最新提示词
 # 生产模式：仅首次初始化时设置默认提示词，之后用户可自行修改
 # 通过环境变量 MY_TYPELESS_DEV=0 可切换到生产模式
@@ -35,6 +36,13 @@ DEFAULT_LLM_PROMPT = (
 )
 
 
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """先写同目录临时文件再 os.replace 覆盖，避免写到一半崩溃导致配置损坏"""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
 @dataclass
 class ProviderConfig:
     id: str
@@ -103,11 +111,19 @@ class AppConfig:
     llm: LLMConfig = field(default_factory=LLMConfig)
     glossary: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        # 组装好的 prompt 缓存：每次听写都会调用，而 prompt/术语只在保存设置时变化。
+        # 作为普通实例属性而非 dataclass 字段，不参与 asdict 序列化与比较；save() 时清空
+        self._llm_system_prompt: str | None = None
+        self._stt_prompt: str | None = None
+
     def build_llm_system_prompt(self) -> str:
         """组装完整的 LLM system prompt（基础 prompt，预留扩展点）"""
-        parts = [self.llm.prompt]
-        # 未来可在此追加 user_context 等段落
-        return "\n\n".join(parts)
+        if self._llm_system_prompt is None:
+            parts = [self.llm.prompt]
+            # 未来可在此追加 user_context 等段落
+            self._llm_system_prompt = "\n\n".join(parts)
+        return self._llm_system_prompt
 
     def build_stt_prompt(self) -> str:
         """组装 STT prompt（术语列表，帮助 Whisper 正确识别专有名词）
@@ -115,26 +131,32 @@ class AppConfig:
         Whisper 将 prompt 视为"此前已转录的文本"，用中文顿号连接术语
         使其更贴合中文转录上下文，避免使用指令性语句。
         """
-        if not self.glossary:
-            return ""
-        return "、".join(self.glossary)
+        if self._stt_prompt is None:
+            self._stt_prompt = "、".join(self.glossary)
+        return self._stt_prompt
 
     def save(self) -> None:
-        """保存配置到 JSON 文件"""
+        """保存配置到 JSON 文件（同时使 prompt 缓存失效）"""
+        self._llm_system_prompt = None
+        self._stt_prompt = None
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        data = asdict(self)
-        CONFIG_FILE.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        _atomic_write_bytes(CONFIG_FILE, jsonio.dumps(asdict(self)))
 
     @classmethod
     def load(cls) -> "AppConfig":
         """从 JSON 文件加载配置，文件不存在则返回默认配置"""
-        if not CONFIG_FILE.exists():
+        # 直接读字节交给 orjson 解析，省去 exists() 的额外 stat 与 UTF-8 解码
+        try:
+            raw = CONFIG_FILE.read_bytes()
+        except FileNotFoundError:
             config = cls()
             config.save()
             return config
 
+        # 仅在配置确有变化（旧格式迁移、解析失败回退、开发模式覆盖提示词）时回写
+        dirty = False
         try:
-            data = json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+            data = jsonio.loads(raw)
 
             # Migration logic for STT
             stt_data = data.get("stt", {})
@@ -207,6 +229,17 @@ class AppConfig:
             glossary = data.get("glossary", [])
             if not isinstance(glossary, list):
                 glossary = []
+                dirty = True
+            else:
+                # 手动编辑的配置可能含非字符串项或重复术语：丢弃非字符串项（不可哈希的项会让去重
+                # 抛出 TypeError，进而把整份配置重置为默认值），再按首次出现顺序去重，
+                # STT prompt 不重复拼接，设置界面的术语集合也与列表一一对应
+                unique = list(dict.fromkeys(t for t in glossary if isinstance(t, str)))
+                if len(unique) != len(glossary):
+                    glossary = unique
+                    dirty = True
+            if "providers" not in stt_data or "providers" not in llm_data:
+                dirty = True
 
             config = cls(
                 hotkey=data.get("hotkey", "right alt"),
@@ -215,12 +248,15 @@ class AppConfig:
                 llm=llm,
                 glossary=glossary,
             )
-        except (json.JSONDecodeError, TypeError, KeyError, ValueError):
+        except (TypeError, KeyError, ValueError):
             config = cls()
+            dirty = True
 
         # 开发模式下强制使用代码中的最新提示词
-        if DEV_MODE:
+        if DEV_MODE and config.llm.prompt != DEFAULT_LLM_PROMPT:
             config.llm.prompt = DEFAULT_LLM_PROMPT
+            dirty = True
 
-        config.save()
+        if dirty:
+            config.save()
         return config
@@ -1,21 +1,55 @@
 """历史记录管理 - SQLite 存储 STT→LLM 精修的输入输出对"""
 
-import json
 import logging
 import sqlite3
+import threading
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
 
+from my_typeless import jsonio
+
 logger = logging.getLogger(__name__)
 
 HISTORY_DIR = Path.home() / ".my-typeless"
 HISTORY_DB = HISTORY_DIR / "history.db"
 _LEGACY_FILE = HISTORY_DIR / "history.json"
 MAX_HISTORY_ENTRIES = 200
+_TIMESTAMP_FMT = "%Y-%m-%d %H:%M"
+
+# history 表的数据列（不含 id），INSERT/SELECT 与旧 JSON 迁移共用这一份定义
+_FIELDS = (
+    "timestamp",
+    "raw_input",
+    "refined_output",
+    "key_press_at",
+    "key_release_at",
+    "stt_done_at",
+    "llm_done_at",
+)
+_INSERT_SQL = (
+    f"INSERT INTO history ({', '.join(_FIELDS)}) VALUES ({', '.join(':' + f for f in _FIELDS)})"
+)
+_SELECT_RECENT_SQL = f"SELECT id, {', '.join(_FIELDS)} FROM history ORDER BY id DESC LIMIT ?"
+# 缓存行（元组）各位置对应的键名
+_ROW_KEYS = ("id", *_FIELDS)
+# 旧 history.json 缺失字段时的默认值（NOT NULL 列补空串，其余补 None）
+_LEGACY_DEFAULTS = {
+    **dict.fromkeys(_FIELDS),
+    "timestamp": "",
+    "raw_input": "",
+    "refined_output": "",
+}
 
 _conn: sqlite3.Connection | None = None
 
+# 最近记录的内存副本（最新在前），设置界面翻页直接读取；写入仍同步落盘。
+# 每行保存为 SELECT 原样返回的元组（按 _ROW_KEYS 排列），只为实际请求的一页构造 dict
+_cache: list[tuple] | None = None
+_cache_lock = threading.Lock()
+# 数据版本号：每次新增或清空时递增，设置界面据此判断已渲染的列表是否过期，未变化时无需重新拉取
+_version = 0
+
 
 @dataclass
 class HistoryEntry:
@@ -38,7 +72,7 @@ class HistoryEntry:
         llm_done_at: str | None = None,
     ) -> "HistoryEntry":
         return HistoryEntry(
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M"),
+            timestamp=time.strftime(_TIMESTAMP_FMT),  # 直接格式化本地时间，无需构造 datetime 对象
             raw_input=raw_input,
             refined_output=refined_output,
             key_press_at=key_press_at,
@@ -74,14 +108,13 @@ def _get_conn() -> sqlite3.Connection:
 
 
 def _prune_history(conn: sqlite3.Connection) -> None:
-    """保留最近的历史记录，删除超出上限的旧记录。"""
+    """保留最近的历史记录，删除超出上限的旧记录。
+
+    id 为 AUTOINCREMENT 单调递增，最近 N 条即 id > MAX(id) - N；
+    按主键区间删除只触及被淘汰的行，无需像 NOT IN 子查询那样扫描全表。
+    """
     conn.execute(
-        """
-        DELETE FROM history
-        WHERE id NOT IN (
-            SELECT id FROM history ORDER BY id DESC LIMIT ?
-        )
-        """,
+        "DELETE FROM history WHERE id <= (SELECT MAX(id) FROM history) - ?",
         (MAX_HISTORY_ENTRIES,),
     )
 
@@ -90,30 +123,22 @@ def _maybe_migrate() -> None:
     if not _LEGACY_FILE.exists():
         return
     try:
-        data = json.loads(_LEGACY_FILE.read_text(encoding="utf-8"))
+        data = jsonio.loads(_LEGACY_FILE.read_bytes())
         if not data:
             _LEGACY_FILE.unlink(missing_ok=True)
             return
+        # 旧版 add_history 把新记录插在列表开头，文件中最新在前；只导入前 MAX_HISTORY_ENTRIES 条
+        # （超出上限的旧记录插入后也会被裁剪，无需写入），并按从旧到新的顺序插入，使 id 随时间递增
+        recent = data[:MAX_HISTORY_ENTRIES]
         conn = _get_conn()
         conn.executemany(
-            "INSERT INTO history (timestamp, raw_input, refined_output, key_press_at, key_release_at, stt_done_at, llm_done_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            [
-                (
-                    e.get("timestamp", ""),
-                    e.get("raw_input", ""),
-                    e.get("refined_output", ""),
-                    e.get("key_press_at"),
-                    e.get("key_release_at"),
-                    e.get("stt_done_at"),
-                    e.get("llm_done_at"),
-                )
-                for e in data
-            ],
+            _INSERT_SQL,
+            [{f: e.get(f, d) for f, d in _LEGACY_DEFAULTS.items()} for e in reversed(recent)],
         )
         _prune_history(conn)
         conn.commit()
         _LEGACY_FILE.unlink(missing_ok=True)
-        logger.info("Migrated %d history entries from JSON to SQLite", len(data))
+        logger.info("Migrated %d history entries from JSON to SQLite", len(recent))
     except Exception:
         logger.exception("Failed to migrate history from JSON to SQLite")
 
@@ -128,6 +153,7 @@ def add_history(
     llm_done_at: str | None = None,
 ) -> None:
     """新增一条历史记录"""
+    global _version
     entry = HistoryEntry.now(
         raw_input,
         refined_output,
@@ -136,55 +162,57 @@ def add_history(
         stt_done_at=stt_done_at,
         llm_done_at=llm_done_at,
     )
-    conn = _get_conn()
-    conn.execute(
-        "INSERT INTO history (timestamp, raw_input, refined_output, key_press_at, key_release_at, stt_done_at, llm_done_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-        (
-            entry.timestamp,
-            entry.raw_input,
-            entry.refined_output,
-            entry.key_press_at,
-            entry.key_release_at,
-            entry.stt_done_at,
-            entry.llm_done_at,
-        ),
-    )
-    _prune_history(conn)
-    conn.commit()
+    # 字段全为字符串，直接取实例字典作为具名 SQL 参数，省去 asdict() 的递归深拷贝
+    row = vars(entry)
+    with _cache_lock:
+        conn = _get_conn()
+        cur = conn.execute(_INSERT_SQL, row)
+        _prune_history(conn)
+        conn.commit()
+
+        # 缓存已加载时同步插入，避免下次翻页重新查询
+        if _cache is not None:
+            _cache.insert(0, (cur.lastrowid, *(row[f] for f in _FIELDS)))
+            del _cache[MAX_HISTORY_ENTRIES:]
+        _version += 1
+
+
+def _load_cache() -> list[tuple]:
+    """首次访问时从数据库载入全部（至多 MAX_HISTORY_ENTRIES 条）记录，调用方需持有锁"""
+    global _cache
+    if _cache is None:
+        conn = _get_conn()
+        _cache = conn.execute(_SELECT_RECENT_SQL, (MAX_HISTORY_ENTRIES,)).fetchall()
+    return _cache
 
 
 def get_history_page(offset: int = 0, limit: int = 20) -> dict:
-    """分页查询历史记录（最新在前）"""
-    conn = _get_conn()
-    rows = conn.execute(
-        "SELECT id, timestamp, raw_input, refined_output, key_press_at, key_release_at, stt_done_at, llm_done_at FROM history ORDER BY id DESC LIMIT ? OFFSET ?",
-        (limit + 1, offset),
-    ).fetchall()
-
-    has_more = len(rows) > limit
-    entries = [
-        {
-            "id": r[0],
-            "timestamp": r[1],
-            "raw_input": r[2],
-            "refined_output": r[3],
-            "key_press_at": r[4],
-            "key_release_at": r[5],
-            "stt_done_at": r[6],
-            "llm_done_at": r[7],
-        }
-        for r in rows[:limit]
-    ]
+    """分页查询历史记录（最新在前），数据来自内存缓存"""
+    with _cache_lock:
+        cache = _load_cache()
+        rows = cache[offset : offset + limit]
+        has_more = len(cache) > offset + limit
+        version = _version
 
     return {
-        "entries": entries,
+        "entries": [dict(zip(_ROW_KEYS, r, strict=True)) for r in rows],
         "has_more": has_more,
         "next_offset": offset + limit if has_more else None,
+        "version": version,
     }
 
 
+def get_history_version() -> int:
+    """当前历史数据版本号，新增或清空记录后改变"""
+    return _version
+
+
 def clear_history() -> None:
     """清空所有历史记录"""
-    conn = _get_conn()
-    conn.execute("DELETE FROM history")
-    conn.commit()
+    global _cache, _version
+    with _cache_lock:
+        conn = _get_conn()
+        conn.execute("DELETE FROM history")
+        conn.commit()
+        _cache = []
+        _version += 1
@@ -1,17 +1,22 @@
 """全局热键监听模块 - 使用 Windows 低级键盘钩子 + 自带消息泵线程"""
 
 import ctypes
+import logging
 import threading
 from ctypes import wintypes
 
 from my_typeless.events import EventEmitter
 
+logger = logging.getLogger(__name__)
+
 # Windows 低级键盘钩子常量
 WH_KEYBOARD_LL = 13
 WM_KEYDOWN = 0x0100
 WM_KEYUP = 0x0101
 WM_SYSKEYDOWN = 0x0104
 WM_SYSKEYUP = 0x0105
+_KEY_DOWN_EVENTS = frozenset((WM_KEYDOWN, WM_SYSKEYDOWN))
+_KEY_EVENTS = _KEY_DOWN_EVENTS | {WM_KEYUP, WM_SYSKEYUP}
 
 # 虚拟键码 → 键名
 _VK_TO_NAME = {
@@ -25,10 +30,10 @@ _VK_TO_NAME = {
     0x10: "shift",
     0x11: "ctrl",
 }
+_NAME_TO_VK = {name: vk for vk, name in _VK_TO_NAME.items()}
 
 # C 类型定义（64 位兼容）
 LRESULT = ctypes.c_ssize_t
-ULONG_PTR = ctypes.c_size_t
 LowLevelKeyboardProc = ctypes.CFUNCTYPE(LRESULT, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
 
 # 设置 Win32 API 类型
@@ -60,15 +65,10 @@ _kernel32.GetCurrentThreadId.restype = wintypes.DWORD
 
 WM_QUIT = 0x0012
 
-
-class KBDLLHOOKSTRUCT(ctypes.Structure):
-    _fields_ = [
-        ("vkCode", wintypes.DWORD),
-        ("scanCode", wintypes.DWORD),
-        ("flags", wintypes.DWORD),
-        ("time", wintypes.DWORD),
-        ("dwExtraInfo", ULONG_PTR),
-    ]
+# lParam 指向 KBDLLHOOKSTRUCT，其首字段 vkCode 为偏移 0 处的 DWORD；
+# 钩子只关心键码，直接按地址读取，省去 cast + 整个结构体对象的构造
+_read_vk_code = wintypes.DWORD.from_address
+_call_next_hook = _user32.CallNextHookEx
 
 
 class HotkeyListener:
@@ -84,6 +84,8 @@ class HotkeyListener:
     def __init__(self, hotkey: str = "right alt"):
         self.events = EventEmitter()
         self._hotkey = hotkey.lower()
+        # 钩子回调对每个全局按键都会执行，预先解析为虚拟键码，回调中只需整数比较
+        self._hotkey_vk = _NAME_TO_VK.get(self._hotkey, -1)
         self._is_pressed = False
         self._hook_id = None
         # 必须保持回调引用防止被 GC
@@ -104,12 +106,17 @@ class HotkeyListener:
         """线程入口：安装钩子 + 运行消息泵"""
         self._thread_id = _kernel32.GetCurrentThreadId()
 
-        self._hook_id = _user32.SetWindowsHookExW(
-            WH_KEYBOARD_LL,
-            self._hook_proc,
-            None,
-            0,
-        )
+        # 低级钩子会让每一次全局按键都回调进 Python；热键无法解析为虚拟键码时
+        # 回调永远不会命中，干脆不安装，只保留消息泵以便 stop() 正常退出
+        if self._hotkey_vk >= 0:
+            self._hook_id = _user32.SetWindowsHookExW(
+                WH_KEYBOARD_LL,
+                self._hook_proc,
+                None,
+                0,
+            )
+        else:
+            logger.warning("Unsupported hotkey %r, keyboard hook not installed", self._hotkey)
 
         # 消息泵（WH_KEYBOARD_LL 回调需要消息泵才能被调度）
         msg = wintypes.MSG()
@@ -138,26 +145,21 @@ class HotkeyListener:
         if was_running:
             self.stop()
         self._hotkey = new_hotkey.lower()
+        self._hotkey_vk = _NAME_TO_VK.get(self._hotkey, -1)
         if was_running:
             self.start()
 
     def _ll_keyboard_proc(self, nCode: int, wParam: int, lParam: int) -> int:
         """低级键盘钩子回调"""
-        if nCode >= 0:
-            kb = ctypes.cast(lParam, ctypes.POINTER(KBDLLHOOKSTRUCT)).contents
-            vk = kb.vkCode
-            key_name = _VK_TO_NAME.get(vk)
-
-            if key_name and key_name == self._hotkey:
-                if wParam in (WM_KEYDOWN, WM_SYSKEYDOWN):
-                    if not self._is_pressed:
-                        self._is_pressed = True
-                        self.events.emit("key_pressed")
-                    return 1  # 吞掉事件，防止 Alt 激活菜单
-                elif wParam in (WM_KEYUP, WM_SYSKEYUP):
-                    if self._is_pressed:
-                        self._is_pressed = False
-                        self.events.emit("key_released")
-                    return 1  # 吞掉事件
-
-        return _user32.CallNextHookEx(self._hook_id, nCode, wParam, lParam)
+        # 绝大多数事件与热键无关：先做最便宜的判断，尽快交还给下一个钩子
+        if nCode < 0 or wParam not in _KEY_EVENTS or _read_vk_code(lParam).value != self._hotkey_vk:
+            return _call_next_hook(self._hook_id, nCode, wParam, lParam)
+
+        if wParam in _KEY_DOWN_EVENTS:
+            if not self._is_pressed:
+                self._is_pressed = True
+                self.events.emit("key_pressed")
+        elif self._is_pressed:
+            self._is_pressed = False
+            self.events.emit("key_released")
+        return 1  # 吞掉事件，防止 Alt 激活菜单
@@ -10,6 +10,26 @@ RESOURCES = Path(__file__).parent / "resources"
 SVG_PATH = RESOURCES / "app_icon.svg"
 ICO_PATH = RESOURCES / "app_icon.ico"
 SIZES = [16, 24, 32, 48, 64, 128, 256]
+# 极小尺寸单独栅格化以保留笔画清晰度，其余尺寸由最大尺寸一次渲染后下采样
+DIRECT_SIZES = [16, 24, 256]
+
+
+def render_svg_png(
+    size: int, *, svg_path: str | None = None, svg_string: str | None = None
+) -> bytes:
+    """将 SVG（路径或源码二选一）栅格化为 size×size 的 PNG 字节，各处图标栅格化共用此入口"""
+    import resvg_py
+
+    # 图标不含文字，跳过系统字体库加载（Windows 上字体众多，加载耗时远超渲染本身）
+    return bytes(
+        resvg_py.svg_to_bytes(
+            svg_path=svg_path,
+            svg_string=svg_string,
+            width=size,
+            height=size,
+            skip_system_fonts=True,
+        )
+    )
 
 
 def ensure_app_ico() -> Path | None:
@@ -19,16 +39,22 @@ def ensure_app_ico() -> Path | None:
     if not SVG_PATH.exists():
         return None
     try:
-        import resvg_py
+        import resvg_py  # noqa: F401  # 仅探测可用性，实际渲染由 render_svg_png 完成
         from PIL import Image
     except ImportError:
         logger.info("resvg_py/Pillow 不可用，跳过 ICO 自动生成（可运行 scripts/build.py）")
         return None
     try:
+        # 只需直接渲染少数几个尺寸，在当前线程依次栅格化（合计约 10ms）；
+        # 本函数也会在运行时首次显示窗口时调用，spawn 进程池的启动开销（约 300ms）远超渲染本身
+        svg_path = str(SVG_PATH)
+        rendered = {
+            s: Image.open(io.BytesIO(render_svg_png(s, svg_path=svg_path))).convert("RGBA")
+            for s in DIRECT_SIZES
+        }
+        base = rendered[max(DIRECT_SIZES)]
         imgs = [
-            Image.open(
-                io.BytesIO(bytes(resvg_py.svg_to_bytes(svg_path=str(SVG_PATH), width=s, height=s)))
-            ).convert("RGBA")
+            rendered[s] if s in rendered else base.resize((s, s), Image.Resampling.LANCZOS)
             for s in SIZES
         ]
         imgs[-1].save(
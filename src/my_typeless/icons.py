@@ -1,28 +1,91 @@
 """图标与资源加载工具 - 使用 Pillow"""
 
+import io
+import sys
 from pathlib import Path
 
 from PIL import Image
 
+from my_typeless.icon_builder import render_svg_png
+
 RESOURCES_DIR = Path(__file__).parent / "resources"
+TRAY_PNG_SIZE = 64  # 构建时预渲染的托盘 PNG 尺寸（scripts/build.py）
+# dev 模式下 SVG 栅格化结果的缓存目录（打包环境使用 RESOURCES_DIR 中预渲染的 PNG）
+ICON_CACHE_DIR = Path.home() / ".my-typeless" / "icons"
+
+# 已解码/缩放的图标按 (名称, 尺寸) 缓存，重复加载直接复用，免去磁盘读取与重采样；
+# 调用方（pystray）只读取图像，共享同一实例是安全的
+_ICON_CACHE: dict[tuple[str, int], Image.Image] = {}
 
 
-def load_tray_icon(name: str, size: int = 64) -> Image.Image:
+def load_tray_icon(name: str, size: int = TRAY_PNG_SIZE) -> Image.Image:
     """加载托盘图标为 PIL Image（pystray 使用）
 
-    优先加载预渲染的 PNG，回退到 ICO。
+    优先加载预渲染的 PNG，回退到 ICO。结果按 (name, size) 缓存。
     """
-    png_path = RESOURCES_DIR / f"{name}.png"
-    if png_path.exists():
-        img = Image.open(png_path)
-        if img.size != (size, size):
-            img = img.resize((size, size), Image.Resampling.LANCZOS)
-        return img
+    key = (name, size)
+    img = _ICON_CACHE.get(key)
+    if img is None:
+        img = _load_tray_icon(name, size)
+        # 立即解码：Pillow 读完像素即关闭文件句柄，缓存中的图像不会一直占用资源文件
+        img.load()
+        _ICON_CACHE[key] = img
+    return img
+
 
-    ico_path = RESOURCES_DIR / f"{name}.ico"
-    if ico_path.exists():
-        img = Image.open(ico_path)
-        img = img.resize((size, size), Image.Resampling.LANCZOS)
+def _png_is_stale(name: str) -> bool:
+    """dev 模式下缓存的 PNG 缺失，或 SVG 比它新（编辑过 SVG）时返回 True，需重新栅格化"""
+    try:
+        png_mtime = (ICON_CACHE_DIR / f"{name}.png").stat().st_mtime
+    except FileNotFoundError:
+        return True
+    try:
+        return (RESOURCES_DIR / f"{name}.svg").stat().st_mtime > png_mtime
+    except FileNotFoundError:
+        return False
+
+
+def _load_tray_icon(name: str, size: int) -> Image.Image:
+    # 打包环境直接打开构建时预渲染的 PNG（缺失时捕获 FileNotFoundError，不做 exists() 探测）；
+    # dev 模式改用用户目录下的栅格化缓存，不向源码树/安装目录写文件
+    frozen = getattr(sys, "frozen", False)
+    png_path = (RESOURCES_DIR if frozen else ICON_CACHE_DIR) / f"{name}.png"
+    if frozen or not _png_is_stale(name):
+        try:
+            img = Image.open(png_path)
+        except FileNotFoundError:
+            pass
+        else:
+            if img.size != (size, size):
+                img = img.resize((size, size), Image.Resampling.LANCZOS)
+            return img
+
+    # 未预渲染 PNG（如 dev 模式）时直接按目标尺寸栅格化 SVG，不经中间尺寸再缩放
+    try:
+        svg = (RESOURCES_DIR / f"{name}.svg").read_text(encoding="utf-8")
+        png = render_svg_png(size, svg_string=svg)
+    except (ImportError, FileNotFoundError):
+        pass
+    else:
+        if size == TRAY_PNG_SIZE and not frozen:
+            # dev 模式首次栅格化后写入缓存目录，之后启动直接解码 PNG
+            try:
+                ICON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                png_path.write_bytes(png)
+            except OSError:
+                pass
+        return Image.open(io.BytesIO(png))
+
+    try:
+        img = Image.open(RESOURCES_DIR / f"{name}.ico")
+    except FileNotFoundError:
+        pass
+    else:
+        # ICO 内含多个尺寸层，有目标尺寸时直接选用该层，避免重采样
+        if (size, size) in img.info.get("sizes", ()):
+            img.size = (size, size)
+        else:
+            img = img.resize((size, size), Image.Resampling.LANCZOS)
         return img
 
     # 回退：生成纯色方块
@@ -30,8 +93,14 @@ def load_tray_icon(name: str, size: int = 64) -> Image.Image:
 
 
 def load_app_icon() -> Image.Image:
-    """加载应用图标为 PIL Image"""
-    ico_path = RESOURCES_DIR / "app_icon.ico"
-    if ico_path.exists():
-        return Image.open(ico_path)
-    return Image.new("RGBA", (256, 256), (59, 157, 245, 255))
+    """加载应用图标为 PIL Image（结果缓存）"""
+    key = ("app_icon", 0)
+    img = _ICON_CACHE.get(key)
+    if img is None:
+        try:
+            img = Image.open(RESOURCES_DIR / "app_icon.ico")
+            img.load()
+        except FileNotFoundError:
+            img = Image.new("RGBA", (256, 256), (59, 157, 245, 255))
+        _ICON_CACHE[key] = img
+    return img
@@ -0,0 +1,25 @@
+"""JSON 编解码 - 优先使用 orjson（C 实现），缺失时回退标准库 json"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
+
+def dumps(obj: Any) -> bytes:
+    """序列化为紧凑的 UTF-8 字节（非 ASCII 字符原样输出，无缩进与多余空白）"""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """解析 JSON；格式错误时抛出 ValueError 的子类"""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
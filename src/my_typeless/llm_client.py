@@ -1,10 +1,14 @@
 """LLM 文本精修客户端 - 支持 OpenAI 兼容 API 和 Anthropic API"""
 
-from anthropic import Anthropic
-from openai import OpenAI
+from typing import TYPE_CHECKING, cast
 
+from my_typeless.api_clients import get_anthropic_client, get_openai_client
 from my_typeless.config import LLMConfig
 
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+    from openai import OpenAI
+
 
 class LLMClient:
     """LLM 文本精修客户端"""
@@ -19,9 +23,9 @@ class LLMClient:
         api_key = config.active_provider.api_key if config.active_provider else ""
 
         if self._provider_type == "anthropic":
-            self._client = Anthropic(api_key=api_key, base_url=base_url if base_url else None)
+            self._client = get_anthropic_client(base_url, api_key)
         else:
-            self._client = OpenAI(base_url=base_url, api_key=api_key)
+            self._client = get_openai_client(base_url, api_key)
 
     def refine(self, raw_text: str, system_prompt: str = "", context: str = "") -> str:
         """
@@ -36,6 +40,10 @@ class LLMClient:
 
         Returns:
             精修后的书面文本
+
+        注：暂不使用流式接口。调用方（worker / webview_api）在松开热键后一次性
+        注入整段文本，逐块产出无法缩短首字延迟，反而要求所有 OpenAI 兼容服务
+        都支持 stream=True；待注入链路支持增量输入后再切换。
         """
         prompt = system_prompt or self._config.prompt
 
@@ -48,8 +56,8 @@ class LLMClient:
             user_message = raw_text
 
         if self._provider_type == "anthropic":
-            assert isinstance(self._client, Anthropic)
-            response = self._client.messages.create(
+            client = cast("Anthropic", self._client)
+            response = client.messages.create(
                 model=self._config.active_model,
                 system=prompt,
                 messages=[
@@ -62,8 +70,8 @@ class LLMClient:
             first = response.content[0]
             return getattr(first, "text", None) or raw_text
         else:
-            assert isinstance(self._client, OpenAI)
-            response = self._client.chat.completions.create(
+            client = cast("OpenAI", self._client)
+            response = client.chat.completions.create(
                 model=self._config.active_model,
                 messages=[
                     {"role": "system", "content": prompt},
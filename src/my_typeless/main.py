@@ -49,6 +49,16 @@ class MyTypelessApp:
     """应用主控制器"""
 
     def __init__(self):
+        self._single_instance = SingleInstance()
+        self._window = None
+        self._allow_close = False
+
+    def _init_components(self) -> None:
+        """创建各组件并连接事件
+
+        在单实例检查通过后才调用：第二个实例只需通知已运行实例后退出，
+        无需加载配置、打开 PortAudio 设备等。
+        """
         self._config = AppConfig.load()
 
         # 初始化组件
@@ -56,15 +66,12 @@ class MyTypelessApp:
         self._hotkey = HotkeyListener(self._config.hotkey)
         self._tray = TrayManager()
         self._updater = UpdateChecker()
-        self._single_instance = SingleInstance()
 
         # 单实例信号服务器
         self._signal_server = SignalServer(on_signal=self._open_window)
 
         # WebView 设置窗口（在 run() 中创建）
         self._api = SettingsAPI(self._config, on_save=self._on_config_saved)
-        self._window = None
-        self._allow_close = False
 
         # 连接事件
         self._connect_events()
@@ -89,9 +96,13 @@ class MyTypelessApp:
         self._tray.on_quit = self._quit
 
     def _open_window(self) -> None:
-        """显示设置窗口（重新加载页面以获取最新配置）"""
+        """显示设置窗口（页面内刷新为最新配置）
+
+        页面在创建窗口时已加载，再次打开只需重新拉取配置填充表单；
+        不重新加载整个页面，省去 Tailwind CDN 重新生成样式与整页布局。
+        """
         if self._window:
-            self._window.load_url(str(_WEB_DIR / "index.html"))
+            self._window.run_js("window.reloadSettings && reloadSettings()")
             self._window.show()
 
     def _on_window_closing(self):
@@ -149,6 +160,8 @@ class MyTypelessApp:
             signal_existing_instance()
             return 0
 
+        self._init_components()
+
         # 创建隐藏的设置窗口（pywebview 需要主线程）
         window = webview.create_window(
             "My Typeless",
@@ -163,14 +176,22 @@ class MyTypelessApp:
         self._window = window
         self._api.set_window(window)
         window.events.closing += self._on_window_closing
-        window.events.shown += lambda: apply_window_icon(window)
+
+        def _apply_icon_once():
+            """WM_SETICON 设置的图标随 HWND 保留，隐藏再显示无需重设，首次显示后即注销"""
+            window.events.shown -= _apply_icon_once
+            apply_window_icon(window)
+
+        window.events.shown += _apply_icon_once
 
         def _start_services():
-            """webview 就绪后启动后台服务"""
+            """webview 就绪后启动后台服务（托盘最先启动，尽早对用户可见）"""
+            self._tray.run_detached()
+            # 钩子安装前加载好其余托盘图标，首次按键时 set_state 只需切换已缓存的图像
+            self._tray.preload_icons()
             self._signal_server.start()
             self._hotkey.start()
             self._updater.start(immediate=True)
-            self._tray.run_detached()
 
         # 主线程运行 webview 事件循环（阻塞直到窗口被销毁）
         webview.start(func=_start_services)
@@ -1,10 +1,10 @@
 """麦克风录音模块 - 使用 pyaudio 录制音频，支持停顿检测与分段回调"""
 
-import io
+import atexit
 import math
+import queue
 import struct
 import threading
-import wave
 from collections.abc import Callable
 
 import pyaudio
@@ -20,40 +20,104 @@ FORMAT = pyaudio.paInt16
 SILENCE_THRESHOLD = 500  # RMS 阈值，低于此值视为静音
 SILENCE_DURATION = 0.6  # 静音持续秒数，超过则认为是停顿
 MIN_SPEECH_DURATION = 0.5  # 最短语音片段时长（秒），过短的片段不发送
+# 连续说话不停顿时也要尽早送出片段，让转录与录音重叠进行：
+# 片段超过 SOFT 时长后，任意一个静音块即视为停顿；超过 MAX 时长则强制切分
+SOFT_SEGMENT_DURATION = 8.0
+MAX_SEGMENT_DURATION = 20.0
+
+_SILENCE_CHUNKS_NEEDED = int(SILENCE_DURATION * SAMPLE_RATE / CHUNK_SIZE)
+_MIN_SPEECH_CHUNKS = int(MIN_SPEECH_DURATION * SAMPLE_RATE / CHUNK_SIZE)
+# 判定语音时直接比较平方和：sum_sq >= THRESHOLD² * count 与 RMS >= THRESHOLD 等价，省去除法与开方
+_SILENCE_THRESHOLD_SQ = SILENCE_THRESHOLD * SILENCE_THRESHOLD
+# PortAudio 每次回调恰为 CHUNK_SIZE 帧，整块的字节数与能量阈值固定，预先算好
+_CHUNK_BYTES = CHUNK_SIZE * SAMPLE_WIDTH
+_CHUNK_ENERGY_THRESHOLD = _SILENCE_THRESHOLD_SQ * CHUNK_SIZE
+# 小端 int16 样本高字节为 0x00 或 0xFF 时 |x| <= 256；阈值高于 256 时，
+# 所有高字节都落在这两个值内的帧 RMS 必然低于阈值，可免去平方和计算
+_QUIET_HIGH_BYTES = b"\x00\xff"
+_QUIET_PRECHECK = SILENCE_THRESHOLD > 256
+_SOFT_SEGMENT_CHUNKS = int(SOFT_SEGMENT_DURATION * SAMPLE_RATE / CHUNK_SIZE)
+_MAX_SEGMENT_CHUNKS = int(MAX_SEGMENT_DURATION * SAMPLE_RATE / CHUNK_SIZE)
+
+# 44 字节 PCM WAV 头：RIFF 块 + fmt 子块 + data 子块头。
+# 格式固定，除两个长度字段外全部预先算好，生成时只需补写长度
+_WAV_HEADER_TEMPLATE = struct.pack(
+    "<4sI4s4sIHHIIHH4sI",
+    b"RIFF",
+    0,  # RIFF 块长度，生成时补写
+    b"WAVE",
+    b"fmt ",
+    16,  # fmt 子块长度
+    1,  # PCM
+    CHANNELS,
+    SAMPLE_RATE,
+    SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH,  # 字节率
+    CHANNELS * SAMPLE_WIDTH,  # 块对齐
+    SAMPLE_WIDTH * 8,  # 位深
+    b"data",
+    0,  # data 子块长度，生成时补写
+)
+_WAV_RIFF_SIZE_OFFSET = 4
+_WAV_DATA_SIZE_OFFSET = 40
+
+# 进程内共享的 PyAudio 实例：初始化 PortAudio 会枚举全部音频设备，开销可观，只做一次
+_pa: pyaudio.PyAudio | None = None
+_pa_lock = threading.Lock()
+
+
+def _shared_pyaudio() -> pyaudio.PyAudio:
+    global _pa
+    with _pa_lock:
+        if _pa is None:
+            _pa = pyaudio.PyAudio()
+            atexit.register(_pa.terminate)
+        return _pa
 
 
 class Recorder:
-    """麦克风录音器，在独立线程中运行，支持停顿检测与分段回调"""
+    """麦克风录音器，以 PortAudio 回调模式采集，支持停顿检测与分段回调"""
 
     def __init__(self):
-        self._audio = pyaudio.PyAudio()
+        self._audio = _shared_pyaudio()
         self._stream: pyaudio.Stream | None = None
-        self._frames: list[bytes] = []
-        self._recording = False
+        self._stream_lock = threading.Lock()
+        # 原始模式下的完整录音，直接追加进连续的 bytearray（摊还 O(1) 扩容），生成 WAV 时无需再 join；
+        # 增量模式下为 None：音频只保留在当前片段缓冲中，长时间听写内存也不会随录音时长增长
+        self._frames: bytearray | None = None
+        # 录音中标志：PortAudio 回调线程与调用方线程共同读写，用 Event 显式同步
+        self._recording = threading.Event()
         self._thread: threading.Thread | None = None
+        # 回调只把原始帧放入队列，停顿检测与 WAV 生成在分析线程中进行，不占用音频线程
+        self._chunks: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+        self._analyzer: threading.Thread | None = None
 
         # 增量转录相关
         self._on_segment: Callable[[bytes], None] | None = None
-        self._segment_frames: list[bytes] = []
-        self._in_speech = False
-        self._silence_chunks = 0
+        self._segment_buf = bytearray()
+        # 当前片段内各帧在 _segment_buf 中的起始字节偏移，用于把帧序号换算为切分位置
+        self._segment_offsets: list[int] = []
 
     def start(self, on_segment: Callable[[bytes], None] | None = None) -> None:
-        """开始录音（在新线程中运行）
+        """开始录音（在新线程中打开音频流，不阻塞调用方）
 
         Args:
-            on_segment: 可选回调，检测到停顿时以 WAV 字节数据调用。
+            on_segment: 可选回调，检测到停顿时在分析线程中以 WAV 字节数据调用，
+                        不阻塞音频采集；耗时处理应交给调用方自己的线程。
                         传入 None 则退化为原始行为（stop 时返回全部音频）。
         """
-        if self._recording:
+        if self._recording.is_set():
             return
-        self._frames = []
-        self._segment_frames = []
-        self._in_speech = False
-        self._silence_chunks = 0
+        self._frames = None if on_segment is not None else bytearray()
+        self._segment_buf = bytearray()
+        self._segment_offsets = []
         self._on_segment = on_segment
-        self._recording = True
-        self._thread = threading.Thread(target=self._record_loop, daemon=True)
+        self._recording.set()
+        # 每次录音使用新队列并作为参数传入，避免与上一轮残留的分析线程混淆
+        self._chunks = queue.SimpleQueue()
+        self._analyzer = threading.Thread(target=self._analyze, args=(self._chunks,), daemon=True)
+        self._analyzer.start()
+        # 打开设备可能耗时数十毫秒，而 start() 由键盘钩子线程调用，须尽快返回
+        self._thread = threading.Thread(target=self._open_stream, daemon=True)
         self._thread.start()
 
     def stop(self) -> bytes:
@@ -62,95 +126,191 @@ class Recorder:
         增量模式（on_segment 不为 None）下只返回尚未通过回调发出的剩余音频。
         原始模式下返回全部录音。
         """
-        self._recording = False
+        self._recording.clear()
         if self._thread:
             self._thread.join(timeout=2.0)
             self._thread = None
+        with self._stream_lock:
+            stream, self._stream = self._stream, None
+        if stream:
+            # stop_stream 会等待进行中的回调结束，之后再读取帧数据是安全的
+            stream.stop_stream()
+            stream.close()
+        # 流已停止，不会再有新帧入队：发送哨兵并等待分析线程处理完积压的帧
+        if self._analyzer:
+            self._chunks.put(None)
+            self._analyzer.join(timeout=2.0)
+            self._analyzer = None
 
         if self._on_segment is not None:
             # 增量模式：返回剩余未发送的音频
-            remaining = self._segment_frames
-            self._segment_frames = []
+            remaining = self._segment_buf
+            self._segment_buf = bytearray()
+            self._segment_offsets = []
             if not remaining:
                 return b""
             return self._build_wav(remaining)
         else:
             # 原始模式：返回全部音频
-            if not self._frames:
+            frames, self._frames = self._frames, None
+            if not frames:
                 return b""
-            return self._build_wav(self._frames)
-
-    def _record_loop(self) -> None:
-        """录音主循环，包含可选的停顿检测逻辑"""
-        silence_chunks_needed = int(SILENCE_DURATION * SAMPLE_RATE / CHUNK_SIZE)
-        min_speech_chunks = int(MIN_SPEECH_DURATION * SAMPLE_RATE / CHUNK_SIZE)
+            return self._build_wav(frames)
 
+    def _open_stream(self) -> None:
+        """打开回调模式的输入流；采集由 PortAudio 线程驱动，无需 Python 读循环"""
         try:
-            self._stream = self._audio.open(
+            stream = self._audio.open(
                 format=FORMAT,
                 channels=CHANNELS,
                 rate=SAMPLE_RATE,
                 input=True,
                 frames_per_buffer=CHUNK_SIZE,
+                stream_callback=self._on_audio,
             )
-            while self._recording:
-                data = self._stream.read(CHUNK_SIZE, exception_on_overflow=False)
-                self._frames.append(data)
+        except Exception:
+            return
+        with self._stream_lock:
+            if self._recording.is_set():
+                self._stream = stream
+                return
+        # 打开期间已调用 stop()：立即关闭
+        stream.stop_stream()
+        stream.close()
 
-                if self._on_segment is None:
-                    continue
+    def _on_audio(self, data: bytes | None, frame_count: int, time_info, status: int):
+        """PortAudio 回调：每满 CHUNK_SIZE 帧调用一次，只负责把帧交给分析线程"""
+        if not self._recording.is_set():
+            return None, pyaudio.paComplete
+        if data is None:
+            # 输入流回调总会带有数据；类型上允许 None，此时跳过该次回调
+            return None, pyaudio.paContinue
+        self._chunks.put(data)
+        return None, pyaudio.paContinue
 
-                # --- 增量模式：停顿检测 ---
-                self._segment_frames.append(data)
-                rms = self._calculate_rms(data)
+    def _analyze(self, chunks: queue.SimpleQueue) -> None:
+        """分析线程：逐帧执行停顿检测，直到收到哨兵 None
+
+        停顿状态只在本线程内使用，以局部变量维护；缓冲区与热路径上的方法也预先绑定为局部变量，
+        每帧只做 LOAD_FAST 而非反复的属性查找。缓冲区均原地修改，stop() 读取的仍是同一对象。
+        """
+        frames = self._frames
+        buf = self._segment_buf
+        offsets = self._segment_offsets
+        is_voiced = self._is_voiced
+        emit = self._emit_segment
+        on_segment = self._on_segment
+        if on_segment is None:
+            # 原始模式：只累积完整录音，不做停顿检测
+            assert frames is not None  # start() 在原始模式下总会创建 _frames
+            for data in iter(chunks.get, None):
+                frames += data
+            return
+
+        in_speech = False
+        silence_chunks = 0
+        # 当前片段首个语音帧在 offsets 中的序号：时长上限与最短语音只按语音开始后的帧数计算，
+        # 不把开头的静音算进去
+        speech_start = 0
 
-                if rms >= SILENCE_THRESHOLD:
+        for data in iter(chunks.get, None):
+            try:
+                # --- 增量模式：停顿检测 ---
+                offsets.append(len(buf))
+                buf += data
+                if is_voiced(data):
                     # 语音活动
-                    self._in_speech = True
-                    self._silence_chunks = 0
-                else:
-                    # 静音
-                    self._silence_chunks += 1
-
-                    if self._in_speech and self._silence_chunks >= silence_chunks_needed:
-                        # 检测到停顿，发送语音片段
-                        speech_end = len(self._segment_frames) - self._silence_chunks
-                        if speech_end >= min_speech_chunks:
-                            segment_wav = self._build_wav(self._segment_frames[:speech_end])
-                            self._on_segment(segment_wav)
-                        # 保留尾部静音帧作为下一段的起始缓冲
-                        self._segment_frames = list(self._segment_frames[-self._silence_chunks :])
-                        self._in_speech = False
-                        self._silence_chunks = 0
-        except Exception:
-            pass
-        finally:
-            if self._stream:
-                self._stream.stop_stream()
-                self._stream.close()
-                self._stream = None
+                    if not in_speech:
+                        in_speech = True
+                        speech_start = len(offsets) - 1
+                    silence_chunks = 0
+                    if len(offsets) - speech_start >= _MAX_SEGMENT_CHUNKS:
+                        # 长时间无停顿：强制切分，已录部分先行转录
+                        emit(on_segment, len(buf))
+                        buf.clear()
+                        offsets.clear()
+                        speech_start = 0
+                    continue
+
+                # 静音
+                if not in_speech:
+                    # 尚未开始说话：只保留最近 _SILENCE_CHUNKS_NEEDED 帧作为语音前的缓冲，
+                    # 长时间静音不会堆积在片段开头
+                    if len(offsets) > _SILENCE_CHUNKS_NEEDED:
+                        drop = len(offsets) - _SILENCE_CHUNKS_NEEDED
+                        cut = offsets[drop]
+                        del buf[:cut]
+                        offsets[:] = [o - cut for o in offsets[drop:]]
+                    continue
+
+                silence_chunks += 1
+                silence_needed = (
+                    _SILENCE_CHUNKS_NEEDED
+                    if len(offsets) - speech_start < _SOFT_SEGMENT_CHUNKS
+                    else 1
+                )
+                if silence_chunks >= silence_needed:
+                    # 检测到停顿，发送语音片段
+                    speech_end = len(offsets) - silence_chunks
+                    cut = offsets[speech_end]
+                    if speech_end - speech_start >= _MIN_SPEECH_CHUNKS:
+                        emit(on_segment, cut)
+                    # 原地删除已发送部分，尾部静音帧留作下一段的起始缓冲
+                    del buf[:cut]
+                    offsets[:] = [o - cut for o in offsets[speech_end:]]
+                    in_speech = False
+                    silence_chunks = 0
+            except Exception:
+                pass
+
+    def _emit_segment(self, on_segment: Callable[[bytes], None], end: int) -> None:
+        """将 _segment_buf 前 end 字节作为一段 WAV 交给 on_segment
+
+        经 memoryview 切片直接写入 WAV 输出，不先复制出中间 bytes；
+        视图在回调前释放，之后才能原地裁剪 bytearray。
+        """
+        with memoryview(self._segment_buf) as view:
+            wav = self._build_wav(view[:end])
+        on_segment(wav)
 
     @staticmethod
-    def _calculate_rms(data: bytes) -> float:
-        """计算一帧音频数据的 RMS（均方根）能量值"""
+    def _is_voiced(data: bytes) -> bool:
+        """该帧能量是否达到语音阈值（等价于 RMS >= SILENCE_THRESHOLD）
+
+        memoryview 直接按 int16 视图读取样本（零拷贝，Windows 为小端序与 PCM 一致），
+        平方和由 C 实现的 math.hypot 一次完成，不逐样本执行 Python 字节码。
+        """
         count = len(data) // SAMPLE_WIDTH
         if count == 0:
-            return 0.0
-        samples = struct.unpack(f"<{count}h", data)
-        sum_sq = sum(s * s for s in samples)
-        return math.sqrt(sum_sq / count)
+            return False
+        if _QUIET_PRECHECK and not data[1::2].translate(None, _QUIET_HIGH_BYTES):
+            # 静音占录音的大部分：按高字节即可判定的安静帧直接返回，比求平方和快约一个数量级
+            return False
+        if len(data) == _CHUNK_BYTES:
+            # 常规整块：能量阈值为预先算好的常量，视图无需切片
+            norm = math.hypot(*memoryview(data).cast("h"))
+            return norm * norm >= _CHUNK_ENERGY_THRESHOLD
+        samples = memoryview(data)
+        if len(data) != count * SAMPLE_WIDTH:
+            # 仅在末尾残缺半个样本时才切片
+            samples = samples[: count * SAMPLE_WIDTH]
+        norm = math.hypot(*samples.cast("h"))
+        return norm * norm >= _SILENCE_THRESHOLD_SQ * count
 
     @staticmethod
-    def _build_wav(frames: list[bytes]) -> bytes:
-        """将录音帧列表转为 WAV 字节数据"""
-        buf = io.BytesIO()
-        with wave.open(buf, "wb") as wf:
-            wf.setnchannels(CHANNELS)
-            wf.setsampwidth(SAMPLE_WIDTH)
-            wf.setframerate(SAMPLE_RATE)
-            wf.writeframes(b"".join(frames))
-        return buf.getvalue()
+    def _build_wav(pcm: bytes | bytearray | memoryview) -> bytes:
+        """将连续的 PCM 数据转为 WAV 字节数据
+
+        直接拼出 WAV 头并与 PCM 一次性 join，只分配一次输出缓冲；
+        不经 wave + BytesIO，省去先合并帧再整体拷贝的两次复制。
+        """
+        data_size = len(pcm)
+        header = bytearray(_WAV_HEADER_TEMPLATE)
+        struct.pack_into("<I", header, _WAV_RIFF_SIZE_OFFSET, 36 + data_size)
+        struct.pack_into("<I", header, _WAV_DATA_SIZE_OFFSET, data_size)
+        return b"".join((header, pcm))
 
     def cleanup(self) -> None:
-        """释放 pyaudio 资源"""
-        self._audio.terminate()
+        """停止进行中的录音；共享的 PyAudio 实例在进程退出时统一释放"""
+        if self._recording.is_set():
+            self.stop()
@@ -3,6 +3,7 @@
 import ctypes
 import logging
 import threading
+import time
 from collections.abc import Callable
 
 import pywintypes
@@ -18,6 +19,11 @@ _ERROR_ALREADY_EXISTS = 183
 _MUTEX_NAME = "MyTypeless_SingleInstance"
 _PIPE_NAME = r"\\.\pipe\MyTypeless_SingleInstance"
 
+# ConnectNamedPipe 连续失败时的退避（秒），以及升级为 warning 日志的连续失败次数
+_RETRY_DELAY = 0.5
+_MAX_RETRY_DELAY = 5.0
+_WARN_AFTER_FAILURES = 5
+
 
 class SingleInstance:
     """通过 Windows Named Mutex 确保单实例运行"""
@@ -69,51 +75,78 @@ class SignalServer:
             )
             win32file.CloseHandle(handle)  # type: ignore[arg-type]
         except pywintypes.error:
-            # pipe 可能正处于两次创建之间，下次循环会检查 _running 并退出
+            # pipe 可能正处于断开与下次等待连接之间，下次循环会检查 _running 并退出
             pass
 
     def _serve(self) -> None:
-        while self._running:
-            try:
-                handle = win32pipe.CreateNamedPipe(
-                    _PIPE_NAME,
-                    win32pipe.PIPE_ACCESS_INBOUND,
-                    win32pipe.PIPE_TYPE_BYTE | win32pipe.PIPE_WAIT,
-                    1,  # 同一时刻只允许 1 个 pipe instance
-                    0,
-                    0,
-                    0,
-                    None,  # type: ignore[arg-type]
-                )
-            except pywintypes.error as e:
-                logger.warning("CreateNamedPipe failed: %s", e)
-                return
-
-            try:
+        # 连接成功时 DisconnectNamedPipe 后即可复用同一 pipe 实例，
+        # 无需反复 CloseHandle + CreateNamedPipe；连接出错时实例状态未知，关闭后重建
+        handle = _create_pipe()
+        failures = 0
+        try:
+            while self._running and handle is not None:
                 try:
-                    win32pipe.ConnectNamedPipe(handle, None)
+                    try:
+                        win32pipe.ConnectNamedPipe(handle, None)
+                    except pywintypes.error as e:
+                        # ERROR_PIPE_CONNECTED: 客户端在 ConnectNamedPipe 调用前已连接，视为成功
+                        if e.winerror != winerror.ERROR_PIPE_CONNECTED:
+                            raise
                 except pywintypes.error as e:
-                    # ERROR_PIPE_CONNECTED: 客户端在 ConnectNamedPipe 调用前已连接，视为成功
-                    if e.winerror != winerror.ERROR_PIPE_CONNECTED:
-                        raise
-
+                    failures += 1
+                    log = logger.warning if failures >= _WARN_AFTER_FAILURES else logger.debug
+                    log("Pipe connection error (%d in a row): %s", failures, e)
+                    _close_pipe(handle)
+                    handle = None
+                    # 退避，避免持续失败时空转占满 CPU
+                    time.sleep(min(_RETRY_DELAY * failures, _MAX_RETRY_DELAY))
+                    if self._running:
+                        handle = _create_pipe()
+                    continue
+
+                failures = 0
                 if self._running:
                     try:
                         self._on_signal()
                     except Exception:
                         # 回调异常不得导致信号线程终止，否则后续第二实例的唤醒全部失效
                         logger.exception("on_signal callback raised")
-            except pywintypes.error as e:
-                logger.debug("Pipe connection error: %s", e)
-            finally:
                 try:
                     win32pipe.DisconnectNamedPipe(handle)
                 except pywintypes.error:
                     pass
-                try:
-                    win32file.CloseHandle(handle)
-                except pywintypes.error:
-                    pass
+        finally:
+            if handle is not None:
+                _close_pipe(handle)
+
+
+def _create_pipe() -> int | None:
+    """创建单实例 pipe，失败时记录警告并返回 None"""
+    try:
+        return win32pipe.CreateNamedPipe(
+            _PIPE_NAME,
+            win32pipe.PIPE_ACCESS_INBOUND,
+            win32pipe.PIPE_TYPE_BYTE | win32pipe.PIPE_WAIT,
+            1,  # 同一时刻只允许 1 个 pipe instance
+            0,
+            0,
+            0,
+            None,  # type: ignore[arg-type]
+        )
+    except pywintypes.error as e:
+        logger.warning("CreateNamedPipe failed: %s", e)
+        return None
+
+
+def _close_pipe(handle: int) -> None:
+    try:
+        win32pipe.DisconnectNamedPipe(handle)
+    except pywintypes.error:
+        pass
+    try:
+        win32file.CloseHandle(handle)
+    except pywintypes.error:
+        pass
 
 
 def signal_existing_instance() -> None:
@@ -1,9 +1,6 @@
 """语音转文字客户端 - 使用 OpenAI 兼容 API (Whisper)"""
 
-import io
-
-from openai import OpenAI
-
+from my_typeless.api_clients import get_openai_client
 from my_typeless.config import STTConfig
 
 
@@ -12,9 +9,9 @@ class STTClient:
 
     def __init__(self, config: STTConfig):
         self._config = config
-        self._client = OpenAI(
-            base_url=config.active_provider.base_url if config.active_provider else "",
-            api_key=config.active_provider.api_key if config.active_provider else "",
+        self._client = get_openai_client(
+            config.active_provider.base_url if config.active_provider else "",
+            config.active_provider.api_key if config.active_provider else "",
         )
 
     def transcribe(self, audio_data: bytes, prompt: str = "") -> str:
@@ -29,12 +26,11 @@ class STTClient:
         Returns:
             转录的原始文本
         """
-        audio_file = io.BytesIO(audio_data)
-        audio_file.name = "recording.wav"
-
+        # (文件名, 内容, MIME) 元组由 SDK 直接交给 httpx 编码 multipart，
+        # 无需先包装成带 name 属性的 BytesIO
         kwargs = {
             "model": self._config.active_model,
-            "file": audio_file,
+            "file": ("recording.wav", audio_data, "audio/wav"),
         }
         if prompt:
             kwargs["prompt"] = prompt
@@ -14,12 +14,19 @@ from my_typeless.version import __version__ as APP_VERSION
 class TrayManager:
     """系统托盘图标管理器 - 三种状态 + 右键菜单"""
 
+    # 状态 → 图标资源名；构造时只加载 idle，其余由 preload_icons() 在后台线程预先加载
+    _ICON_NAMES = {
+        "idle": "icon_idle",
+        "recording": "icon_recording",
+        "processing": "icon_processing",
+    }
+    _TOOLTIPS = {
+        "idle": "My Typeless - Ready",
+        "recording": "My Typeless - Recording...",
+        "processing": "My Typeless - Processing...",
+    }
+
     def __init__(self):
-        self._icons = {
-            "idle": load_tray_icon("icon_idle"),
-            "recording": load_tray_icon("icon_recording"),
-            "processing": load_tray_icon("icon_processing"),
-        }
         self._state = "idle"
 
         # 回调（由 main.py 设置）
@@ -28,8 +35,8 @@ class TrayManager:
 
         self._icon = pystray.Icon(
             name="my-typeless",
-            icon=self._icons["idle"],
-            title="My Typeless - Ready",
+            icon=load_tray_icon(self._ICON_NAMES["idle"]),
+            title=self._TOOLTIPS["idle"],
             menu=Menu(
                 MenuItem(
                     "Open",
@@ -58,21 +65,28 @@ class TrayManager:
         thread = threading.Thread(target=self._icon.run, daemon=True)
         thread.start()
 
+    def preload_icons(self) -> None:
+        """预先加载录音/处理状态图标（在后台线程调用）
+
+        set_state 由低级键盘钩子回调同步调用，钩子必须尽快返回；
+        图标须在钩子安装前解码（dev 模式下还要栅格化 SVG），不能留到首次按键时才加载。
+        """
+        for state, name in self._ICON_NAMES.items():
+            if state != "idle":
+                load_tray_icon(name)
+
     def stop(self) -> None:
         """停止托盘图标"""
         self._icon.stop()
 
     def set_state(self, state: str) -> None:
         """切换托盘图标状态 (idle / recording / processing)"""
-        tooltips = {
-            "idle": "My Typeless - Ready",
-            "recording": "My Typeless - Recording...",
-            "processing": "My Typeless - Processing...",
-        }
-        if state in self._icons:
-            self._state = state
-            self._icon.icon = self._icons[state]
-            self._icon.title = tooltips.get(state, "My Typeless")
+        # pystray 每次设置 icon 都会把图像重新编码为 HICON，状态未变时直接跳过
+        if state == self._state or state not in self._ICON_NAMES:
+            return
+        self._state = state
+        self._icon.icon = load_tray_icon(self._ICON_NAMES[state])
+        self._icon.title = self._TOOLTIPS[state]
 
     def show_notification(self, title: str, message: str) -> None:
         """显示 Windows 通知气泡"""
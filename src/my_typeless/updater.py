@@ -11,13 +11,10 @@
 import json
 import logging
 import shutil
-import subprocess
 import tempfile
 import threading
 from dataclasses import dataclass
 from pathlib import Path
-from urllib.error import URLError
-from urllib.request import Request, urlopen
 
 from my_typeless.config import DEV_MODE
 from my_typeless.events import EventEmitter
@@ -73,6 +70,11 @@ def fetch_latest_release() -> ReleaseInfo | None:
     从 GitHub API 获取最新 Release 信息。
     返回 None 表示无可用更新或请求失败。
     """
+    # urllib.request 会连带导入 http.client、ssl、email 等，推迟到后台检查线程中首次使用时加载，
+    # 不拖慢启动
+    from urllib.error import URLError
+    from urllib.request import Request, urlopen
+
     url = f"{GITHUB_API}/releases/latest"
     req = Request(
         url,
@@ -127,6 +129,9 @@ def download_release(release: ReleaseInfo, dest: Path, progress_cb=None) -> bool
     下载 Release 资产到 dest 路径。
     progress_cb(downloaded_bytes, total_bytes) 可选进度回调。
     """
+    from urllib.error import URLError
+    from urllib.request import Request, urlopen
+
     req = Request(
         release.download_url,
         headers={
@@ -160,6 +165,8 @@ def apply_update(setup_exe: Path) -> bool:
     运行下载的安装程序执行静默升级。
     成功启动安装程序后返回 True，由调用方负责退出当前进程。
     """
+    import subprocess
+
     if not setup_exe.exists():
         logger.error("Setup file not found: %s", setup_exe)
         return False
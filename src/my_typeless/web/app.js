@@ -3,6 +3,7 @@
 let currentConfig = {};
 let currentHotkey = 'right alt';
 let glossaryTerms = [];
+let glossarySet = new Set(); // mirrors glossaryTerms for O(1) duplicate checks
 let sttProviders = [];
 let llmProviders = [];
 let activeSttProviderId = '';
@@ -10,24 +11,56 @@ let activeSttModel = '';
 let activeLlmProviderId = '';
 let activeLlmModel = '';
 let modalModels = [];
+let currentPage = 'general';
+
+// Shared Tailwind class strings, defined once instead of repeated at each use site
+const STATUS_DOT_CLASS = {
+    error: 'w-2 h-2 rounded-full bg-red-400',
+    running: 'w-2 h-2 rounded-full bg-primary',
+    done: 'w-2 h-2 rounded-full bg-green-500',
+};
+const STATUS_BADGE_CLASS = {
+    active: 'px-2.5 py-1 bg-primary text-white text-[10px] font-bold rounded tracking-widest',
+    inactive: 'px-2.5 py-1 bg-border-gray rounded-full text-[10px] font-bold text-primary tracking-wider',
+};
+const STATUS_MESSAGE_CLASS = 'text-center text-text-muted text-sm py-8';
 
 // ── Initialization ──
 
 window.addEventListener('pywebviewready', async () => {
     try {
-        const [config, version] = await Promise.all([
-            pywebview.api.get_config(),
+        const [version] = await Promise.all([
             pywebview.api.get_version(),
+            loadConfig(),
         ]);
-        currentConfig = config;
-        currentHotkey = config.hotkey || 'right alt';
         document.getElementById('versionLabel').textContent = `v${version}`;
-        populateForms(config);
     } catch (e) {
         console.error('Init failed:', e);
     }
 });
 
+async function loadConfig() {
+    const config = await pywebview.api.get_config();
+    currentConfig = config;
+    currentHotkey = config.hotkey || 'right alt';
+    populateForms(config);
+}
+
+// Called from Python each time the hidden window is shown again. The document, its styles and
+// Tailwind's generated CSS stay as they are; only the form data is refreshed, discarding any
+// unsaved edits, instead of reloading and laying out the whole page from scratch.
+async function reloadSettings() {
+    const modal = document.getElementById('providerModal');
+    modal.classList.add('hidden', 'opacity-0');
+    document.getElementById('providerModalContent').classList.add('scale-95');
+    switchPage('general');
+    try {
+        await loadConfig();
+    } catch (e) {
+        console.error('Reload failed:', e);
+    }
+}
+
 function populateForms(config) {
     // General
     setText('hotkeyBtn', config.hotkey || currentHotkey);
@@ -37,7 +70,6 @@ function populateForms(config) {
     sttProviders = normalizeProviders(config.stt?.providers);
     activeSttProviderId = resolveActiveProviderId(sttProviders, config.stt?.active_provider_id);
     activeSttModel = resolveActiveModel(sttProviders, activeSttProviderId, config.stt?.active_model);
-    renderProviderList('stt');
     renderProviderDropdown('stt');
 
     // LLM
@@ -49,12 +81,16 @@ function populateForms(config) {
     setValue('llmKey', activeLlmProvider?.api_key || '');
     setValue('llmModel', activeLlmModel || '');
     setValue('llmPrompt', config.llm?.prompt || '');
-    renderProviderList('llm');
     renderProviderDropdown('llm');
 
     // Glossary
-    glossaryTerms = [...(config.glossary || [])];
-    renderGlossary();
+    // Set insertion order keeps the first occurrence, so duplicates are dropped without reordering
+    glossarySet = new Set(config.glossary || []);
+    glossaryTerms = [...glossarySet];
+
+    // List views are built on first visit; only the page currently on screen is rendered now
+    Object.keys(pageRenderers).forEach(name => stalePages.add(name));
+    renderPageIfStale(currentPage);
 
     // Update status badges
     updateStatusBadge('sttStatusBadge', !!findProvider(sttProviders, activeSttProviderId)?.api_key);
@@ -64,17 +100,26 @@ function populateForms(config) {
 function updateStatusBadge(id, active) {
     const badge = document.getElementById(id);
     if (!badge) return;
-    if (active) {
-        badge.textContent = 'ACTIVE';
-        badge.className = 'px-2.5 py-1 bg-primary text-white text-[10px] font-bold rounded tracking-widest';
-    } else {
-        badge.textContent = 'INACTIVE';
-        badge.className = 'px-2.5 py-1 bg-border-gray rounded-full text-[10px] font-bold text-primary tracking-wider';
-    }
+    badge.textContent = active ? 'ACTIVE' : 'INACTIVE';
+    badge.className = STATUS_BADGE_CLASS[active ? 'active' : 'inactive'];
 }
 
 // ── Navigation ──
 
+// Pages whose list views are rendered lazily, the first time they are shown after new data arrives.
+// Form fields that collectFormData reads (dropdowns, inputs) are still filled eagerly in populateForms.
+const pageRenderers = {
+    stt: () => renderProviderList('stt'),
+    llm: () => renderProviderList('llm'),
+    glossary: renderGlossary,
+};
+const stalePages = new Set();
+
+function renderPageIfStale(pageName) {
+    if (!stalePages.delete(pageName)) return;
+    pageRenderers[pageName]();
+}
+
 document.getElementById('navList').addEventListener('click', (e) => {
     const item = e.target.closest('.nav-item');
     if (!item) return;
@@ -95,8 +140,10 @@ function switchPage(pageName) {
     document.querySelectorAll('.page').forEach(el => el.classList.remove('active'));
     const page = document.getElementById(`page-${pageName}`);
     if (page) page.classList.add('active');
+    currentPage = pageName;
 
-    if (pageName === 'history') loadHistory();
+    renderPageIfStale(pageName);
+    if (pageName === 'history') refreshHistoryIfStale();
 }
 
 // ── Config Save / Cancel ──
@@ -169,6 +216,7 @@ async function applyConfig() {
 
 function startHotkeyCapture() {
     const btn = document.getElementById('hotkeyBtn');
+    if (btn.classList.contains('listening')) return; // a capture hook is already installed
     btn.textContent = 'Press a key...';
     btn.classList.add('listening');
     pywebview.api.start_hotkey_capture();
@@ -257,55 +305,77 @@ async function testModalConnection() {
 
 function renderGlossary() {
     const list = document.getElementById('glossaryList');
-    list.replaceChildren();
 
+    // Old rows are removed and new ones inserted in a single replaceChildren mutation
     if (glossaryTerms.length === 0) {
-        list.appendChild(createStatusMessage('No terms added yet.'));
+        list.replaceChildren(getEmptyState('No terms added yet.'));
     } else {
         const fragment = document.createDocumentFragment();
         glossaryTerms.forEach((term, i) => {
-            const item = document.createElement('div');
-            item.className = 'flex items-center px-4 py-3 border-b border-border-gray group hover:bg-neutral-50 transition-colors';
-            item.dataset.index = String(i);
-            item.addEventListener('click', () => toggleGlossarySelect(item));
-
-            const checkbox = document.createElement('input');
-            checkbox.type = 'checkbox';
-            checkbox.className = 'rounded border-border-gray text-primary focus:ring-0 cursor-pointer size-4';
-            checkbox.addEventListener('click', (event) => {
-                event.stopPropagation();
-                item.classList.toggle('bg-neutral-50', checkbox.checked);
-            });
-
-            const text = document.createElement('span');
-            text.className = 'ml-4 text-sm font-medium text-primary';
-            text.textContent = safeText(term);
-
-            item.append(checkbox, text);
-            fragment.appendChild(item);
+            fragment.appendChild(createGlossaryItem(term, i));
         });
-        list.appendChild(fragment);
+        list.replaceChildren(fragment);
     }
+    updateGlossaryCount();
+}
+
+function createGlossaryItem(term, index) {
+    const item = document.createElement('div');
+    item.className = 'glossary-item';
+    item.dataset.index = String(index);
+
+    const checkbox = document.createElement('input');
+    checkbox.type = 'checkbox';
+    checkbox.className = 'rounded border-border-gray text-primary focus:ring-0 cursor-pointer size-4';
+
+    const text = document.createElement('span');
+    text.className = 'glossary-item-text';
+    text.textContent = safeText(term);
+
+    item.append(checkbox, text);
+    return item;
+}
+
+function updateGlossaryCount() {
     document.getElementById('glossaryCount').textContent = `${glossaryTerms.length} term(s)`;
 }
 
 function addGlossaryTerm() {
     const input = document.getElementById('glossaryInput');
     const term = input.value.trim();
-    if (!term || glossaryTerms.includes(term)) {
+    if (!term || glossarySet.has(term)) {
         input.value = '';
         return;
     }
     glossaryTerms.push(term);
+    glossarySet.add(term);
     input.value = '';
-    renderGlossary();
+
+    // Append only the new row instead of rebuilding the whole list (keeps selections intact)
+    if (glossaryTerms.length === 1) {
+        renderGlossary();
+        return;
+    }
+    document.getElementById('glossaryList').appendChild(createGlossaryItem(term, glossaryTerms.length - 1));
+    updateGlossaryCount();
 }
 
+// One delegated listener handles every glossary row instead of two closures per row
+document.getElementById('glossaryList').addEventListener('click', (event) => {
+    const item = event.target.closest('[data-index]');
+    if (!item) return;
+    if (event.target.matches('input[type="checkbox"]')) {
+        item.classList.toggle('selected', event.target.checked);
+    } else {
+        toggleGlossarySelect(item);
+    }
+});
+
 function toggleGlossarySelect(el) {
     const checkbox = el.querySelector('input[type="checkbox"]');
     if (!checkbox) return;
     checkbox.checked = !checkbox.checked;
-    el.classList.toggle('bg-neutral-50', checkbox.checked);
+    el.classList.toggle('selected', checkbox.checked);
 }
 
 function deleteSelectedTerms() {
@@ -316,7 +386,11 @@ function deleteSelectedTerms() {
         if (cb?.checked) toRemove.add(parseInt(item.dataset.index));
     });
     if (toRemove.size === 0) return;
-    glossaryTerms = glossaryTerms.filter((_, i) => !toRemove.has(i));
+    glossaryTerms = glossaryTerms.filter((term, i) => {
+        if (!toRemove.has(i)) return true;
+        glossarySet.delete(term);
+        return false;
+    });
     renderGlossary();
 }
 
@@ -324,14 +398,11 @@ function deleteSelectedTerms() {
 
 async function runTest() {
     const raw = document.getElementById('testInput').value.trim();
-    const statusDot = document.getElementById('testStatusDot');
-    const statusText = document.getElementById('testStatus');
     const runBtn = document.getElementById('testRunBtn');
     const output = document.getElementById('testOutput');
 
     if (!raw) {
-        statusDot.className = 'w-2 h-2 rounded-full bg-red-400';
-        statusText.textContent = 'Enter text first';
+        setTestStatus('error', 'Enter text first');
         return;
     }
 
@@ -340,28 +411,30 @@ async function runTest() {
     runBtn.disabled = true;
     setButtonContent(runBtn, 'progress_activity', 'Running...', 'text-[16px] animate-spin');
     output.value = '';
-    statusDot.className = 'w-2 h-2 rounded-full bg-primary';
-    statusText.textContent = 'Calling LLM...';
+    setTestStatus('running', 'Calling LLM...');
 
     try {
         const result = await pywebview.api.run_test(raw, llmOverride);
         if (result.success) {
             output.value = result.result || '';
-            statusDot.className = 'w-2 h-2 rounded-full bg-green-500';
-            statusText.textContent = 'Done';
+            setTestStatus('done', 'Done');
         } else {
-            statusDot.className = 'w-2 h-2 rounded-full bg-red-400';
-            statusText.textContent = `Error: ${result.error}`;
+            setTestStatus('error', `Error: ${result.error}`);
         }
     } catch (e) {
-        statusDot.className = 'w-2 h-2 rounded-full bg-red-400';
-        statusText.textContent = `Error: ${e}`;
+        setTestStatus('error', `Error: ${e}`);
     } finally {
         runBtn.disabled = false;
         setButtonContent(runBtn, 'play_arrow', 'Run');
     }
 }
 
+// One helper owns the status dot + label pair so each state change is a single call
+function setTestStatus(state, text) {
+    document.getElementById('testStatusDot').className = STATUS_DOT_CLASS[state];
+    document.getElementById('testStatus').textContent = text;
+}
+
 function copyTestOutput() {
     const text = document.getElementById('testOutput').value;
     if (text) navigator.clipboard.writeText(text);
@@ -372,55 +445,83 @@ function copyTestOutput() {
 let historyOffset = 0;
 let historyLoading = false;
 let historyHasMore = true;
+let historyVersion = null; // backend history version the rendered list was loaded at
 
-function renderHistoryEntry(e) {
+// History cards share one structure: build it once lazily, then deep-clone per entry
+let historyCardTemplate = null;
+
+function getHistoryCardTemplate() {
+    if (historyCardTemplate) return historyCardTemplate;
+
+    // Styles live in the .history-card-* rules of index.html
     const card = document.createElement('div');
-    card.className = 'border border-gray-200 rounded-lg overflow-hidden bg-white flex flex-col';
+    card.className = 'history-card';
 
     const header = document.createElement('div');
-    header.className = 'px-4 py-2 bg-gray-50 border-b border-gray-200 flex justify-between items-center';
+    header.className = 'history-card-header';
     const timestamp = document.createElement('span');
-    timestamp.className = 'text-[10px] font-medium text-gray-500 uppercase tracking-tight';
-    timestamp.textContent = safeText(e.timestamp);
+    timestamp.className = 'history-card-time';
+    timestamp.dataset.field = 'timestamp';
     header.appendChild(timestamp);
 
     const content = document.createElement('div');
-    content.className = 'grid grid-cols-2 min-h-[80px]';
+    content.className = 'history-card-body';
 
     const inputColumn = document.createElement('div');
-    inputColumn.className = 'p-4 border-r border-gray-100';
+    inputColumn.className = 'history-card-col';
     const inputLabel = document.createElement('label');
-    inputLabel.className = 'block text-[10px] font-bold text-gray-400 uppercase mb-2';
+    inputLabel.className = 'history-card-label';
     inputLabel.textContent = 'Input';
     const inputText = document.createElement('p');
-    inputText.className = 'text-sm text-gray-600 leading-relaxed';
-    inputText.textContent = safeText(e.raw_input);
+    inputText.className = 'history-card-input';
+    inputText.dataset.field = 'raw_input';
     inputColumn.append(inputLabel, inputText);
 
     const outputColumn = document.createElement('div');
-    outputColumn.className = 'p-4';
+    outputColumn.className = 'history-card-col';
     const outputLabel = document.createElement('label');
-    outputLabel.className = 'block text-[10px] font-bold text-gray-400 uppercase mb-2';
+    outputLabel.className = 'history-card-label';
     outputLabel.textContent = 'Output';
     const outputText = document.createElement('p');
-    outputText.className = 'text-sm text-primary font-medium leading-relaxed';
-    outputText.textContent = safeText(e.refined_output);
+    outputText.className = 'history-card-output';
+    outputText.dataset.field = 'refined_output';
     outputColumn.append(outputLabel, outputText);
 
     content.append(inputColumn, outputColumn);
     card.append(header, content);
+    historyCardTemplate = card;
     return card;
 }
 
+function renderHistoryEntry(e) {
+    const card = getHistoryCardTemplate().cloneNode(true);
+    card.querySelectorAll('[data-field]').forEach((el) => {
+        el.textContent = safeText(e[el.dataset.field]);
+    });
+    return card;
+}
+
+// Re-entering the History page only reloads when entries were added or cleared meanwhile
+async function refreshHistoryIfStale() {
+    if (historyVersion !== null) {
+        try {
+            if (await pywebview.api.get_history_version() === historyVersion) return;
+        } catch (e) {
+            // fall through to a full reload
+        }
+    }
+    await loadHistory();
+}
+
 async function loadHistory() {
     historyOffset = 0;
     historyHasMore = true;
     historyLoading = false;
-    document.getElementById('historyList').replaceChildren();
-    await loadMoreHistory();
+    // Keep the old cards until the first page arrives, then swap everything in one mutation
+    await loadMoreHistory(true);
 }
 
-async function loadMoreHistory() {
+async function loadMoreHistory(replace = false) {
     if (historyLoading || !historyHasMore) return;
     historyLoading = true;
     const list = document.getElementById('historyList');
@@ -428,16 +529,21 @@ async function loadMoreHistory() {
         const data = await pywebview.api.get_history(historyOffset, 20);
         const entries = data.entries || [];
         historyHasMore = data.has_more;
+        if (replace) historyVersion = data.version;
         if (data.next_offset != null) historyOffset = data.next_offset;
 
         if (entries.length === 0 && historyOffset === 0) {
-            list.replaceChildren(createStatusMessage('No history entries yet.'));
+            list.replaceChildren(getEmptyState('No history entries yet.'));
         } else {
             const fragment = document.createDocumentFragment();
             entries.forEach((entry) => {
                 fragment.appendChild(renderHistoryEntry(entry));
             });
-            list.appendChild(fragment);
+            if (replace) {
+                list.replaceChildren(fragment);
+            } else {
+                list.appendChild(fragment);
+            }
         }
     } catch (e) {
         if (historyOffset === 0) {
@@ -458,14 +564,17 @@ document.getElementById('historyList').addEventListener('scroll', () => {
 
 async function clearAllHistory() {
     if (!confirm('Clear all history entries?')) return;
+    // Empty the list right away; the database delete finishes on the bridge thread
+    historyOffset = 0;
+    historyHasMore = false;
+    historyLoading = false;
+    historyVersion = null;
+    document.getElementById('historyList').replaceChildren(getEmptyState('No history entries yet.'));
     try {
         await pywebview.api.clear_history();
-        historyOffset = 0;
-        historyHasMore = true;
-        historyLoading = false;
-        document.getElementById('historyList').replaceChildren(createStatusMessage('No history entries yet.'));
     } catch (e) {
         alert('Failed: ' + e);
+        await loadHistory();
     }
 }
 
@@ -498,9 +607,7 @@ function escapeHtml(str) {
 }
 
 function setButtonContent(button, iconName, label, iconClass = 'text-[16px]') {
-    const icon = document.createElement('span');
-    icon.className = `material-symbols-outlined ${iconClass}`;
-    icon.textContent = iconName;
+    const icon = createIcon(iconName, iconClass);
     const text = document.createElement('span');
     text.textContent = label;
     button.replaceChildren(icon, text);
@@ -514,9 +621,21 @@ function safeText(value) {
     return value == null ? '' : String(value);
 }
 
+// Fixed empty-state messages are built once and re-attached on every render that needs them
+const emptyStates = new Map();
+
+function getEmptyState(text) {
+    let message = emptyStates.get(text);
+    if (!message) {
+        message = createStatusMessage(text);
+        emptyStates.set(text, message);
+    }
+    return message;
+}
+
 function createStatusMessage(text) {
     const message = document.createElement('p');
-    message.className = 'text-center text-text-muted text-sm py-8';
+    message.className = STATUS_MESSAGE_CLASS;
     message.textContent = text;
     return message;
 }
@@ -529,11 +648,19 @@ function createOption(value, label, selected = false) {
     return option;
 }
 
+// Icon spans are built once per (name, class) pair and cloned for every later use
+const iconTemplates = new Map();
+
 function createIcon(name, className = '') {
-    const icon = document.createElement('span');
-    icon.className = `material-symbols-outlined ${className}`.trim();
-    icon.textContent = name;
-    return icon;
+    const key = `${name}|${className}`;
+    let icon = iconTemplates.get(key);
+    if (!icon) {
+        icon = document.createElement('span');
+        icon.className = `material-symbols-outlined ${className}`.trim();
+        icon.textContent = name;
+        iconTemplates.set(key, icon);
+    }
+    return icon.cloneNode(true);
 }
 
 function normalizeProviders(providers) {
@@ -653,49 +780,45 @@ function renderProviderList(type) {
     const providers = type === 'stt' ? sttProviders : llmProviders;
     const list = document.getElementById(`${type}ProviderList`);
     if (!list) return;
-    list.replaceChildren();
 
     if (providers.length === 0) {
         const row = document.createElement('tr');
         const cell = document.createElement('td');
         cell.colSpan = 4;
-        cell.className = 'px-6 py-8 text-center text-gray-500';
+        cell.className = 'provider-empty';
         cell.textContent = 'No providers configured. Click "New Provider" to add one.';
         row.appendChild(cell);
-        list.appendChild(row);
+        list.replaceChildren(row);
         return;
     }
 
     const fragment = document.createDocumentFragment();
     providers.forEach((p) => {
         const row = document.createElement('tr');
-        row.className = 'hover:bg-gray-50 transition-colors group';
+        row.className = 'provider-row';
+        row.dataset.providerId = p.id;
 
         const nameCell = document.createElement('td');
-        nameCell.className = 'px-6 py-4 whitespace-nowrap';
-        const name = document.createElement('div');
-        name.className = 'font-semibold text-primary';
-        name.textContent = safeText(p.name);
-        nameCell.appendChild(name);
+        nameCell.className = 'provider-name';
+        nameCell.textContent = safeText(p.name);
 
         const urlCell = document.createElement('td');
-        urlCell.className = 'px-6 py-4 whitespace-nowrap text-gray-500 font-mono text-xs';
+        urlCell.className = 'provider-url';
         urlCell.textContent = safeText(p.base_url);
 
         const modelsCell = document.createElement('td');
-        modelsCell.className = 'px-6 py-4';
         const modelsWrapper = document.createElement('div');
-        modelsWrapper.className = 'flex flex-wrap gap-1';
+        modelsWrapper.className = 'provider-models';
         const models = Array.isArray(p.models) ? p.models : [];
         if (models.length === 0) {
             const empty = document.createElement('span');
-            empty.className = 'text-gray-400 text-xs italic';
+            empty.className = 'provider-models-empty';
             empty.textContent = 'No models';
             modelsWrapper.appendChild(empty);
         } else {
             models.forEach((model) => {
                 const modelTag = document.createElement('span');
-                modelTag.className = 'inline-flex items-center px-2 py-0.5 rounded text-xs font-medium bg-gray-100 text-gray-800 border border-gray-200';
+                modelTag.className = 'provider-model-tag';
                 modelTag.textContent = safeText(model);
                 modelsWrapper.appendChild(modelTag);
             });
@@ -703,22 +826,22 @@ function renderProviderList(type) {
         modelsCell.appendChild(modelsWrapper);
 
         const actionsCell = document.createElement('td');
-        actionsCell.className = 'px-6 py-4 whitespace-nowrap text-right text-sm font-medium';
+        actionsCell.className = 'provider-actions-cell';
         const actions = document.createElement('div');
-        actions.className = 'flex items-center justify-end gap-2 opacity-0 group-hover:opacity-100 transition-opacity';
+        actions.className = 'provider-actions';
 
         const editButton = document.createElement('button');
         editButton.type = 'button';
-        editButton.className = 'p-1 text-gray-400 hover:text-primary transition-colors';
+        editButton.className = 'provider-action';
         editButton.title = 'Edit';
-        editButton.addEventListener('click', () => editProvider(type, p.id));
+        editButton.dataset.action = 'edit';
         editButton.appendChild(createIcon('edit', 'text-[18px]'));
 
         const deleteButton = document.createElement('button');
         deleteButton.type = 'button';
-        deleteButton.className = 'p-1 text-gray-400 hover:text-red-600 transition-colors';
+        deleteButton.className = 'provider-action';
         deleteButton.title = 'Delete';
-        deleteButton.addEventListener('click', () => deleteProvider(type, p.id));
+        deleteButton.dataset.action = 'delete';
         deleteButton.appendChild(createIcon('delete', 'text-[18px]'));
 
         actions.append(editButton, deleteButton);
@@ -726,9 +849,23 @@ function renderProviderList(type) {
         row.append(nameCell, urlCell, modelsCell, actionsCell);
         fragment.appendChild(row);
     });
-    list.appendChild(fragment);
+    list.replaceChildren(fragment);
 }
 
+// Row actions go through one delegated listener per table instead of per-row closures
+['stt', 'llm'].forEach((type) => {
+    document.getElementById(`${type}ProviderList`)?.addEventListener('click', (event) => {
+        const button = event.target.closest('button[data-action]');
+        if (!button) return;
+        const id = button.closest('tr').dataset.providerId;
+        if (button.dataset.action === 'edit') {
+            editProvider(type, id);
+        } else {
+            deleteProvider(type, id);
+        }
+    });
+});
+
 // ── Modal Logic ──
 
 function openProviderModal(type, providerId = null) {
@@ -777,28 +914,31 @@ function closeProviderModal() {
 
 function renderModalModels() {
     const container = document.getElementById('modalModelsContainer');
-    container.replaceChildren();
-
     const fragment = document.createDocumentFragment();
     modalModels.forEach((m, i) => {
         const tag = document.createElement('div');
-        tag.className = 'inline-flex items-center gap-1 px-2.5 py-1 rounded-md bg-gray-100 border border-gray-200 text-sm font-medium text-primary';
+        tag.className = 'model-chip';
 
         const label = document.createElement('span');
         label.textContent = safeText(m);
 
         const button = document.createElement('button');
         button.type = 'button';
-        button.className = 'text-gray-400 hover:text-red-500 rounded-full flex items-center justify-center p-0.5';
-        button.addEventListener('click', () => removeModalModel(i));
+        button.className = 'model-chip-remove';
+        button.dataset.index = String(i);
         button.appendChild(createIcon('close', 'text-[14px]'));
 
         tag.append(label, button);
         fragment.appendChild(tag);
     });
-    container.appendChild(fragment);
+    container.replaceChildren(fragment);
 }
 
+document.getElementById('modalModelsContainer').addEventListener('click', (event) => {
+    const button = event.target.closest('button[data-index]');
+    if (button) removeModalModel(parseInt(button.dataset.index));
+});
+
 function handleModelInputKeyDown(e) {
     if (e.key === 'Enter') {
         e.preventDefault();
@@ -1,19 +1,30 @@
 """pywebview API 桥接 - 将 Python 后端暴露给前端 JS"""
 
 import logging
+import threading
 from collections.abc import Callable
 from dataclasses import asdict
 
 import keyboard
-from openai import OpenAI
 
 from my_typeless.config import AppConfig
-from my_typeless.history import add_history, clear_history, get_history_page
+from my_typeless.history import (
+    add_history,
+    clear_history,
+    get_history_page,
+    get_history_version,
+)
 from my_typeless.llm_client import LLMClient
 from my_typeless.version import __version__
 
 logger = logging.getLogger(__name__)
 
+# 设置界面历史卡片实际渲染的字段
+_HISTORY_CARD_FIELDS = ("id", "timestamp", "raw_input", "refined_output")
+
+# 热键捕获回调在全局键盘钩子线程上处理每一次按键，常量预先取出，免去逐事件的模块属性查找
+_KEY_DOWN = keyboard.KEY_DOWN
+
 # 允许的热键列表
 ALLOWED_HOTKEYS = [
     "left alt",
@@ -43,6 +54,8 @@ ALLOWED_HOTKEYS = [
     "f11",
     "f12",
 ]
+# 捕获时的成员判断用集合，列表项均已小写
+_ALLOWED_HOTKEY_SET = frozenset(ALLOWED_HOTKEYS)
 
 
 class SettingsAPI:
@@ -52,9 +65,11 @@ class SettingsAPI:
         self._config = config
         self._on_save = on_save
         self._window = None
+        # pywebview 为每次 JS 调用新开线程，连点或重复触发时用非阻塞锁保证同一时刻只有一个测试请求
+        self._test_lock = threading.Lock()
 
     def set_window(self, window):
-        """设置 webview 窗口引用（用于 evaluate_js 回调）"""
+        """设置 webview 窗口引用（用于 run_js 回调前端）"""
         self._window = window
 
     def get_config(self) -> dict:
@@ -102,8 +117,18 @@ class SettingsAPI:
             return {"success": False, "error": str(e)}
 
     def get_history(self, offset: int = 0, limit: int = 20) -> dict:
-        """返回历史记录（分页）"""
-        return get_history_page(offset, limit)
+        """返回历史记录（分页）
+
+        历史卡片只展示时间与输入/输出文本，各阶段耗时字段不在界面中出现，
+        不随每页经 JS 桥序列化传给前端。
+        """
+        page = get_history_page(offset, limit)
+        page["entries"] = [{f: e[f] for f in _HISTORY_CARD_FIELDS} for e in page["entries"]]
+        return page
+
+    def get_history_version(self) -> int:
+        """返回历史数据版本号，前端据此判断是否需要重新加载"""
+        return get_history_version()
 
     def clear_history(self) -> dict:
         """清空历史记录"""
@@ -111,45 +136,54 @@ class SettingsAPI:
         return {"success": True}
 
     def run_test(self, raw_text: str, llm_override: dict | None = None) -> dict:
-        """测试 LLM 精修"""
+        """测试 LLM 精修（已有测试进行中时直接返回错误，不再叠加请求）"""
+        if not self._test_lock.acquire(blocking=False):
+            return {"success": False, "error": "A test is already running"}
+        try:
+            return self._run_test(raw_text, llm_override)
+        finally:
+            self._test_lock.release()
+
+    def _run_test(self, raw_text: str, llm_override: dict | None) -> dict:
         try:
             llm_config = self._config.llm
             active_provider = llm_config.active_provider
             if not active_provider:
                 return {"success": False, "error": "No active LLM provider configured"}
 
-            base_url = active_provider.base_url
-            api_key = active_provider.api_key
-            model = llm_config.active_model
             prompt = llm_config.prompt
-
             if llm_override:
-                base_url = llm_override.get("base_url", base_url)
-                api_key = llm_override.get("api_key", api_key)
-                model = llm_override.get("model", model)
-                prompt = llm_override.get("prompt", prompt)
-
-            glossary = self._config.glossary
-            temp_config = AppConfig(glossary=glossary)
-            temp_config.llm.prompt = prompt
-            system_prompt = temp_config.build_llm_system_prompt()
+                # 仅在有覆盖参数时才构造临时配置；否则直接沿用当前 LLM 配置，
+                # 底层 HTTP 客户端按 (base_url, api_key) 缓存，多次测试复用同一连接池
+                from my_typeless.config import LLMConfig as ConfigLLMConfig
+                from my_typeless.config import ProviderConfig
 
-            # We need to temporarily modify the active provider details for LLMClient
-            # Since LLMClient just expects an LLMConfig, we can build a temp one.
-            from my_typeless.config import LLMConfig as ConfigLLMConfig
-            from my_typeless.config import ProviderConfig
+                model = llm_override.get("model", llm_config.active_model)
+                prompt = llm_override.get("prompt", prompt)
+                temp_provider = ProviderConfig(
+                    id="temp",
+                    name="temp",
+                    base_url=llm_override.get("base_url", active_provider.base_url),
+                    api_key=llm_override.get("api_key", active_provider.api_key),
+                    models=[model],
+                    provider_type=llm_override.get("provider_type", active_provider.provider_type),
+                )
+                llm_config = ConfigLLMConfig(
+                    providers=[temp_provider],
+                    active_provider_id="temp",
+                    active_model=model,
+                    prompt=prompt,
+                )
 
-            temp_provider = ProviderConfig(
-                id="temp", name="temp", base_url=base_url, api_key=api_key, models=[model]
-            )
-            temp_llm_config = ConfigLLMConfig(
-                providers=[temp_provider],
-                active_provider_id="temp",
-                active_model=model,
-                prompt=prompt,
-            )
+            if prompt == self._config.llm.prompt:
+                # 与当前配置一致时直接用其缓存的 system prompt（保存配置时才失效），连续测试不重复组装
+                system_prompt = self._config.build_llm_system_prompt()
+            else:
+                temp_config = AppConfig(glossary=self._config.glossary)
+                temp_config.llm.prompt = prompt
+                system_prompt = temp_config.build_llm_system_prompt()
 
-            client = LLMClient(temp_llm_config)
+            client = LLMClient(llm_config)
             result = client.refine(raw_text, system_prompt=system_prompt)
 
             if raw_text.strip() and result:
@@ -169,23 +203,28 @@ class SettingsAPI:
         return ALLOWED_HOTKEYS
 
     def start_hotkey_capture(self) -> None:
-        """开始捕获热键按键，结果通过 evaluate_js 回调"""
+        """开始捕获热键按键，结果通过 run_js 回调
+
+        回调运行在 keyboard 库的事件线程上：evaluate_js 会阻塞等待前端返回并序列化结果，
+        run_js 只投递脚本即返回，不拖住后续按键事件的分发。
+        """
 
         def on_key(event):
-            if event.event_type != keyboard.KEY_DOWN:
+            if event.event_type != _KEY_DOWN:
                 return
             name = event.name
             if not name:
                 return
-            if name.lower() == "esc":
+            name = name.lower()
+            if name == "esc":
                 keyboard.unhook(hook)
                 if self._window:
-                    self._window.evaluate_js("onHotkeyCaptured(null)")
+                    self._window.run_js("onHotkeyCaptured(null)")
                 return
-            if name.lower() in [k.lower() for k in ALLOWED_HOTKEYS]:
+            if name in _ALLOWED_HOTKEY_SET:
                 keyboard.unhook(hook)
                 if self._window:
-                    self._window.evaluate_js(f"onHotkeyCaptured('{name.lower()}')")
+                    self._window.run_js(f"onHotkeyCaptured('{name}')")
 
         hook = keyboard.hook(on_key, suppress=False)
 
@@ -217,6 +256,8 @@ class SettingsAPI:
                         "success": False,
                         "error": "Base URL is required for OpenAI compatible providers",
                     }
+                from openai import OpenAI
+
                 client = OpenAI(base_url=base_url, api_key=api_key)
                 client.models.retrieve(model)
 
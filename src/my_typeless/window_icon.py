@@ -1,6 +1,7 @@
 """Win32 helpers to set HWND icon for the PyWebView window on Windows."""
 
 import ctypes
+import functools
 import logging
 import sys
 from ctypes import wintypes
@@ -20,10 +21,11 @@ SM_CXICON = 11
 SM_CXSMICON = 49
 
 
-def _load_hicon(ico_path: Path, size: int):
-    user32 = ctypes.windll.user32
-    user32.LoadImageW.restype = wintypes.HANDLE
-    user32.LoadImageW.argtypes = [
+# Win32 函数原型在导入时绑定一次，避免每次调用重复设置 argtypes/restype
+if sys.platform == "win32":
+    _user32 = ctypes.windll.user32
+    _user32.LoadImageW.restype = wintypes.HANDLE
+    _user32.LoadImageW.argtypes = [
         wintypes.HINSTANCE,
         wintypes.LPCWSTR,
         wintypes.UINT,
@@ -31,7 +33,10 @@ def _load_hicon(ico_path: Path, size: int):
         ctypes.c_int,
         wintypes.UINT,
     ]
-    return user32.LoadImageW(
+
+
+def _load_hicon(ico_path: Path, size: int):
+    return _user32.LoadImageW(
         None,
         str(ico_path),
         IMAGE_ICON,
@@ -41,6 +46,15 @@ def _load_hicon(ico_path: Path, size: int):
     )
 
 
+@functools.cache
+def _icon_sizes() -> tuple[int, int]:
+    """返回系统大/小图标尺寸；进程内只查询一次"""
+    return (
+        _user32.GetSystemMetrics(SM_CXICON) or 32,
+        _user32.GetSystemMetrics(SM_CXSMICON) or 16,
+    )
+
+
 def apply_window_icon(window) -> None:
     """为 pywebview 窗口的 HWND 设置应用图标"""
     if sys.platform != "win32":
@@ -53,18 +67,16 @@ def apply_window_icon(window) -> None:
         hwnd = int(getattr(window, "native_handle", 0) or 0)
         if not hwnd:
             # 兼容某些 pywebview 构建：通过窗口标题查找
-            hwnd = ctypes.windll.user32.FindWindowW(None, "My Typeless")
+            hwnd = _user32.FindWindowW(None, "My Typeless")
         if not hwnd:
             logger.warning("Failed to obtain HWND for window icon")
             return
-        user32 = ctypes.windll.user32
-        big = user32.GetSystemMetrics(SM_CXICON) or 32
-        small = user32.GetSystemMetrics(SM_CXSMICON) or 16
+        big, small = _icon_sizes()
         h_big = _load_hicon(ico_path, big)
         h_small = _load_hicon(ico_path, small)
         if h_big:
-            user32.SendMessageW(hwnd, WM_SETICON, ICON_BIG, h_big)
+            _user32.SendMessageW(hwnd, WM_SETICON, ICON_BIG, h_big)
         if h_small:
-            user32.SendMessageW(hwnd, WM_SETICON, ICON_SMALL, h_small)
+            _user32.SendMessageW(hwnd, WM_SETICON, ICON_SMALL, h_small)
     except Exception as e:
         logger.warning("Failed to set window icon: %s", e)
@@ -23,6 +23,19 @@ _SENTINEL = object()
 # Whisper prompt 上限约 224 tokens；对中文约 400 字符，取尾部以保留最近上下文
 _MAX_PROMPT_CHARS = 400
 
+# LLM 精修的前文上下文只取尾部：仅用于衔接语气与标点，
+# 不随录音时长线性增长，避免长段听写时输入 token 与延迟不断攀升
+_MAX_LLM_CONTEXT_CHARS = 800
+
+
+def _now_hms() -> str:
+    """当前本地时间，格式 HH:MM:SS.ffffff（用于各阶段打点）
+
+    time.isoformat 为 C 实现的固定格式输出，比逐字符解析格式串的 strftime 快数倍；
+    指定 microseconds 保证微秒恒为 6 位，与原 "%H:%M:%S.%f" 输出一致。
+    """
+    return datetime.now().time().isoformat("microseconds")
+
 
 def _update_transcription_tail(current_tail: str, new_text: str, max_chars: int) -> str:
     """维护 STT 上下文尾部，始终只保留最近 max_chars 个字符。"""
@@ -91,8 +104,6 @@ class Worker:
         error_occurred(str, bool): 发生错误 (消息, 是否严重)
     """
 
-    _TIME_FMT = "%H:%M:%S.%f"
-
     def __init__(
         self,
         config: AppConfig,
@@ -119,7 +130,7 @@ class Worker:
     def start_recording(self) -> None:
         """开始录音，同时启动增量转录消费线程"""
         logger.debug("start_recording called")
-        self._key_press_at = datetime.now().strftime(self._TIME_FMT)
+        self._key_press_at = _now_hms()
         self.events.emit("state_changed", "recording")
 
         self._segment_queue = queue.Queue()
@@ -138,7 +149,7 @@ class Worker:
         """停止录音，将剩余音频送入队列并通知消费线程结束"""
         logger.debug("stop_recording_and_process called")
         remaining = self._recorder.stop()
-        key_release_at = datetime.now().strftime(self._TIME_FMT)
+        key_release_at = _now_hms()
 
         if remaining:
             logger.debug("Remaining audio: %d bytes", len(remaining))
@@ -153,7 +164,7 @@ class Worker:
     # ------------------------------------------------------------------
 
     def _on_segment(self, wav_data: bytes) -> None:
-        """Recorder 停顿检测回调 - 由录音线程调用"""
+        """Recorder 停顿检测回调 - 由录音分析线程调用，只入队不做 I/O"""
         logger.debug("Segment detected: %d bytes", len(wav_data))
         self._segment_queue.put(wav_data)
 
@@ -206,12 +217,12 @@ class Worker:
                 refined = llm.refine(
                     text,
                     system_prompt=llm_system_prompt,
-                    context=accumulated_refined,
+                    context=accumulated_refined[-_MAX_LLM_CONTEXT_CHARS:],
                 )
                 logger.debug("Segment LLM result: %r", refined)
                 accumulated_refined += refined
 
-            done_at = datetime.now().strftime(self._TIME_FMT)
+            done_at = _now_hms()
 
             # 拼接全部结果
             raw_text = "".join(transcription_parts)
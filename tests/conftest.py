@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -14,3 +15,20 @@ def isolated_config_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Pat
     monkeypatch.setattr(config_module, "CONFIG_FILE", config_file)
     monkeypatch.setattr(config_module, "DEV_MODE", False)
     return config_file
+
+
+@pytest.fixture
+def isolated_history_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Redirect history storage to a temp SQLite file and reset the shared connection."""
+    from my_typeless import history as history_module
+
+    history_dir = tmp_path / ".my-typeless"
+    history_db = history_dir / "history.db"
+    monkeypatch.setattr(history_module, "HISTORY_DIR", history_dir)
+    monkeypatch.setattr(history_module, "HISTORY_DB", history_db)
+    monkeypatch.setattr(history_module, "_LEGACY_FILE", history_dir / "history.json")
+    monkeypatch.setattr(history_module, "_conn", None)
+    monkeypatch.setattr(history_module, "_cache", None)
+    yield history_db
+    if history_module._conn is not None:
+        history_module._conn.close()
@@ -0,0 +1,83 @@
+import sys
+import types
+
+import pytest
+
+from my_typeless import api_clients as api_clients_module
+
+
+class _FakeClient:
+    """Stand-in for an SDK client: counts fresh constructions and tracks the shared pool."""
+
+    created = 0
+
+    def __init__(self, *, base_url=None, api_key: str = "", _pool: object | None = None) -> None:
+        if _pool is None:
+            type(self).created += 1
+            _pool = object()
+        self.base_url = base_url
+        self.api_key = api_key
+        self.pool = _pool
+
+    def with_options(self, *, api_key: str) -> "_FakeClient":
+        return type(self)(base_url=self.base_url, api_key=api_key, _pool=self.pool)
+
+
+class _FakeOpenAI(_FakeClient):
+    created = 0
+
+
+class _FakeAnthropic(_FakeClient):
+    created = 0
+
+
+@pytest.fixture
+def fake_sdks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace the openai/anthropic SDK modules and reset the client caches."""
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=_FakeOpenAI))
+    monkeypatch.setitem(sys.modules, "anthropic", types.SimpleNamespace(Anthropic=_FakeAnthropic))
+    monkeypatch.setattr(_FakeOpenAI, "created", 0)
+    monkeypatch.setattr(_FakeAnthropic, "created", 0)
+    monkeypatch.setattr(api_clients_module, "_openai_clients", {})
+    monkeypatch.setattr(api_clients_module, "_anthropic_clients", {})
+
+
+def test_openai_client_is_reused_for_same_base_url_and_key(fake_sdks) -> None:
+    first = api_clients_module.get_openai_client("https://a.example/v1", "k1")
+    second = api_clients_module.get_openai_client("https://a.example/v1", "k1")
+
+    assert second is first
+    assert _FakeOpenAI.created == 1
+
+
+def test_openai_client_for_new_base_url_gets_its_own_pool(fake_sdks) -> None:
+    first = api_clients_module.get_openai_client("https://a.example/v1", "k1")
+    other = api_clients_module.get_openai_client("https://b.example/v1", "k1")
+
+    assert other is not first
+    assert other.pool is not first.pool
+    assert _FakeOpenAI.created == 2
+
+
+def test_openai_api_key_change_derives_from_cached_client(fake_sdks) -> None:
+    first = api_clients_module.get_openai_client("https://a.example/v1", "k1")
+    rotated = api_clients_module.get_openai_client("https://a.example/v1", "k2")
+
+    assert rotated is not first
+    assert rotated.api_key == "k2"
+    assert rotated.pool is first.pool
+    assert _FakeOpenAI.created == 1
+    assert api_clients_module.get_openai_client("https://a.example/v1", "k2") is rotated
+
+
+def test_anthropic_client_cache_reuses_and_derives(fake_sdks) -> None:
+    first = api_clients_module.get_anthropic_client("", "k1")
+    assert api_clients_module.get_anthropic_client("", "k1") is first
+    assert first.base_url is None  # 空 base_url 交给 SDK 默认地址
+
+    rotated = api_clients_module.get_anthropic_client("", "k2")
+    assert rotated.pool is first.pool
+
+    other = api_clients_module.get_anthropic_client("https://proxy.example", "k1")
+    assert other.pool is not first.pool
+    assert _FakeAnthropic.created == 2
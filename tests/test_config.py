@@ -83,3 +83,49 @@ def test_load_creates_default_config_when_file_missing(isolated_config_file: Pat
 
     saved = json.loads(isolated_config_file.read_text(encoding="utf-8"))
     assert saved["hotkey"] == "right alt"
+
+
+def test_load_does_not_rewrite_unchanged_config(isolated_config_file: Path) -> None:
+    # Arrange: a config already in the current schema.
+    config_module.AppConfig().save()
+    isolated_config_file.write_bytes(isolated_config_file.read_bytes() + b"\n")
+    before = isolated_config_file.read_bytes()
+
+    # Act
+    config_module.AppConfig.load()
+
+    # Assert: the file is left untouched (the trailing newline survives).
+    assert isolated_config_file.read_bytes() == before
+
+
+def test_prompt_cache_is_refreshed_on_save(isolated_config_file: Path) -> None:
+    cfg = config_module.AppConfig(glossary=["MyTypeless"])
+    assert cfg.build_stt_prompt() == "MyTypeless"
+    assert cfg.build_llm_system_prompt() == config_module.DEFAULT_LLM_PROMPT
+
+    cfg.glossary = ["MyTypeless", "Whisper"]
+    cfg.llm.prompt = "custom prompt"
+    cfg.save()
+
+    assert cfg.build_stt_prompt() == "MyTypeless、Whisper"
+    assert cfg.build_llm_system_prompt() == "custom prompt"
+    assert "_stt_prompt" not in json.loads(isolated_config_file.read_text(encoding="utf-8"))
+
+
+def test_load_deduplicates_glossary(isolated_config_file: Path) -> None:
+    # Arrange: a hand-edited config repeats a term and contains non-string items.
+    config_module.AppConfig(
+        glossary=["MyTypeless", "Whisper", "MyTypeless", ["nested"], 42],
+        hotkey="f8",
+    ).save()
+
+    # Act
+    cfg = config_module.AppConfig.load()
+
+    # Assert: first string occurrences are kept in order, the rest of the config survives,
+    # and the cleaned list is written back.
+    assert cfg.glossary == ["MyTypeless", "Whisper"]
+    assert cfg.hotkey == "f8"
+    assert cfg.build_stt_prompt() == "MyTypeless、Whisper"
+    saved = json.loads(isolated_config_file.read_text(encoding="utf-8"))
+    assert saved["glossary"] == ["MyTypeless", "Whisper"]
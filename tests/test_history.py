@@ -0,0 +1,74 @@
+import json
+from pathlib import Path
+
+from my_typeless import history as history_module
+
+
+def test_add_history_keeps_only_most_recent_entries(isolated_history_db: Path, monkeypatch) -> None:
+    monkeypatch.setattr(history_module, "MAX_HISTORY_ENTRIES", 3)
+
+    for i in range(5):
+        history_module.add_history(f"raw-{i}", f"refined-{i}")
+
+    page = history_module.get_history_page(0, 10)
+    assert [e["raw_input"] for e in page["entries"]] == ["raw-4", "raw-3", "raw-2"]
+    assert page["has_more"] is False
+
+
+def test_add_history_after_clear_starts_fresh(isolated_history_db: Path, monkeypatch) -> None:
+    monkeypatch.setattr(history_module, "MAX_HISTORY_ENTRIES", 2)
+
+    history_module.add_history("old-1", "o1")
+    history_module.add_history("old-2", "o2")
+    history_module.clear_history()
+    history_module.add_history("new", "n")
+
+    page = history_module.get_history_page(0, 10)
+    assert [e["raw_input"] for e in page["entries"]] == ["new"]
+
+
+def test_get_history_page_reflects_writes_after_cache_loaded(isolated_history_db: Path) -> None:
+    history_module.add_history("first", "f")
+    assert [e["raw_input"] for e in history_module.get_history_page()["entries"]] == ["first"]
+
+    history_module.add_history("second", "s", key_press_at="09:00:00.000000")
+
+    page = history_module.get_history_page(0, 1)
+    assert page["entries"][0]["raw_input"] == "second"
+    assert page["entries"][0]["key_press_at"] == "09:00:00.000000"
+    assert page["has_more"] is True
+    assert page["next_offset"] == 1
+
+    history_module.clear_history()
+    assert history_module.get_history_page()["entries"] == []
+
+
+def test_legacy_migration_imports_only_most_recent_entries(
+    isolated_history_db: Path, monkeypatch
+) -> None:
+    monkeypatch.setattr(history_module, "MAX_HISTORY_ENTRIES", 2)
+    # 旧版 history.json 最新在前
+    legacy = [
+        {"timestamp": "", "raw_input": f"raw-{i}", "refined_output": ""} for i in reversed(range(4))
+    ]
+    history_module._LEGACY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    history_module._LEGACY_FILE.write_bytes(json.dumps(legacy).encode("utf-8"))
+
+    page = history_module.get_history_page(0, 10)
+
+    assert [e["raw_input"] for e in page["entries"]] == ["raw-3", "raw-2"]
+    assert not history_module._LEGACY_FILE.exists()
+
+
+def test_history_version_changes_only_on_writes(isolated_history_db: Path) -> None:
+    start = history_module.get_history_version()
+    assert history_module.get_history_page()["version"] == start
+
+    history_module.add_history("raw", "refined")
+    after_add = history_module.get_history_version()
+    assert after_add != start
+    assert history_module.get_history_page()["version"] == after_add
+    assert history_module.get_history_version() == after_add
+
+    history_module.clear_history()
+    assert history_module.get_history_version() != after_add
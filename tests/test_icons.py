@@ -0,0 +1,89 @@
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from my_typeless import icons as icons_module
+
+
+def _png_bytes(color: tuple[int, int, int, int]) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGBA", (icons_module.TRAY_PNG_SIZE,) * 2, color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def icon_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, Path, list[int]]:
+    """Isolate resources / cache dirs and replace the SVG rasterizer with a counting stub."""
+    resources = tmp_path / "resources"
+    cache = tmp_path / ".my-typeless" / "icons"
+    resources.mkdir()
+    (resources / "icon_idle.svg").write_text("<svg/>", encoding="utf-8")
+    monkeypatch.setattr(icons_module, "RESOURCES_DIR", resources)
+    monkeypatch.setattr(icons_module, "ICON_CACHE_DIR", cache)
+    monkeypatch.setattr(icons_module, "_ICON_CACHE", {})
+
+    calls: list[int] = []
+
+    def fake_render(size: int, **_kwargs) -> bytes:
+        calls.append(size)
+        return _png_bytes((255, 0, 0, 255))
+
+    monkeypatch.setattr(icons_module, "render_svg_png", fake_render)
+    return resources, cache, calls
+
+
+def test_dev_rasterization_is_cached_outside_resources(icon_dirs) -> None:
+    resources, cache, calls = icon_dirs
+
+    img = icons_module._load_tray_icon("icon_idle", icons_module.TRAY_PNG_SIZE)
+
+    assert img.getpixel((0, 0)) == (255, 0, 0, 255)
+    assert calls == [icons_module.TRAY_PNG_SIZE]
+    assert (cache / "icon_idle.png").exists()
+    assert not (resources / "icon_idle.png").exists()
+
+    # 缓存 PNG 比 SVG 新：直接解码，不再栅格化
+    icons_module._load_tray_icon("icon_idle", icons_module.TRAY_PNG_SIZE)
+    assert len(calls) == 1
+
+
+def test_cached_png_is_regenerated_when_svg_is_newer(icon_dirs) -> None:
+    resources, cache, calls = icon_dirs
+    cache.mkdir(parents=True)
+    cached = cache / "icon_idle.png"
+    cached.write_bytes(_png_bytes((0, 0, 255, 255)))
+    svg = resources / "icon_idle.svg"
+    os.utime(cached, (1_000, 1_000))
+    os.utime(svg, (2_000, 2_000))
+
+    img = icons_module._load_tray_icon("icon_idle", icons_module.TRAY_PNG_SIZE)
+
+    assert img.getpixel((0, 0)) == (255, 0, 0, 255)
+    assert calls == [icons_module.TRAY_PNG_SIZE]
+    assert Image.open(cached).getpixel((0, 0)) == (255, 0, 0, 255)
+
+
+def test_frozen_build_uses_bundled_png_without_staleness_check(
+    icon_dirs, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    resources, cache, calls = icon_dirs
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    bundled = resources / "icon_idle.png"
+    bundled.write_bytes(_png_bytes((0, 255, 0, 255)))
+    os.utime(bundled, (1_000, 1_000))
+    os.utime(resources / "icon_idle.svg", (2_000, 2_000))
+
+    def fail_stale(_name: str) -> bool:
+        raise AssertionError("frozen builds must not stat the SVG")
+
+    monkeypatch.setattr(icons_module, "_png_is_stale", fail_stale)
+
+    img = icons_module._load_tray_icon("icon_idle", icons_module.TRAY_PNG_SIZE)
+
+    assert img.getpixel((0, 0)) == (0, 255, 0, 255)
+    assert calls == []
+    assert not cache.exists()
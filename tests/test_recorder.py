@@ -0,0 +1,172 @@
+import importlib
+import io
+import struct
+import sys
+import types
+import wave
+
+import pytest
+
+
+class _FakePyAudio:
+    def terminate(self) -> None:
+        pass
+
+
+@pytest.fixture
+def recorder_module(monkeypatch: pytest.MonkeyPatch):
+    """在 pyaudio stub 环境中导入 recorder 模块。"""
+    monkeypatch.setitem(
+        sys.modules,
+        "pyaudio",
+        types.SimpleNamespace(
+            PyAudio=_FakePyAudio,
+            paInt16=8,
+            paContinue=0,
+            paComplete=1,
+        ),
+    )
+    module = importlib.import_module("my_typeless.recorder")
+    return importlib.reload(module)
+
+
+def test_build_wav_matches_wave_module(recorder_module):
+    frames = [b"\x01\x00\x02\x00", b"\xff\x7f", b"\x00\x80\x10\x00"]
+
+    data = recorder_module.Recorder._build_wav(b"".join(frames))
+
+    expected = io.BytesIO()
+    with wave.open(expected, "wb") as wf:
+        wf.setnchannels(recorder_module.CHANNELS)
+        wf.setsampwidth(recorder_module.SAMPLE_WIDTH)
+        wf.setframerate(recorder_module.SAMPLE_RATE)
+        wf.writeframes(b"".join(frames))
+    assert data == expected.getvalue()
+
+
+def test_audio_callback_emits_segment_after_pause(recorder_module):
+    rec = recorder_module.Recorder()
+    segments: list[bytes] = []
+    rec.start(on_segment=segments.append)
+
+    samples = recorder_module.CHUNK_SIZE
+    loud = b"\xe8\x03" * samples  # 1000，高于静音阈值
+    quiet = b"\x00\x00" * samples
+    speech_chunks = recorder_module._MIN_SPEECH_CHUNKS + 1
+    for chunk in [loud] * speech_chunks + [quiet] * recorder_module._SILENCE_CHUNKS_NEEDED:
+        assert rec._on_audio(chunk, samples, None, 0) == (None, recorder_module.pyaudio.paContinue)
+    rec.stop()
+
+    assert segments == [recorder_module.Recorder._build_wav(loud * speech_chunks)]
+    assert rec._on_audio(quiet, samples, None, 0) == (None, recorder_module.pyaudio.paComplete)
+
+
+def test_audio_callback_splits_long_speech_without_pause(recorder_module):
+    rec = recorder_module.Recorder()
+    segments: list[bytes] = []
+    rec.start(on_segment=segments.append)
+
+    samples = recorder_module.CHUNK_SIZE
+    loud = b"\xe8\x03" * samples
+    quiet = b"\x00\x00" * samples
+    max_chunks = recorder_module._MAX_SEGMENT_CHUNKS
+    soft_chunks = recorder_module._SOFT_SEGMENT_CHUNKS
+
+    # 超过上限的连续语音被强制切分
+    for _ in range(max_chunks + 1):
+        rec._on_audio(loud, samples, None, 0)
+    # 超过 SOFT 时长后，单个静音块即可结束片段
+    for _ in range(soft_chunks):
+        rec._on_audio(loud, samples, None, 0)
+    rec._on_audio(quiet, samples, None, 0)
+    rec.stop()
+
+    assert segments == [
+        recorder_module.Recorder._build_wav(loud * max_chunks),
+        recorder_module.Recorder._build_wav(loud * (soft_chunks + 1)),
+    ]
+
+
+def test_recorders_share_one_pyaudio_instance(recorder_module):
+    assert recorder_module.Recorder()._audio is recorder_module.Recorder()._audio
+
+
+def test_is_voiced_matches_rms_threshold(recorder_module):
+    threshold = recorder_module.SILENCE_THRESHOLD
+    cases = {
+        0: False,
+        255: False,
+        256: False,
+        threshold - 1: False,
+        threshold: True,
+        threshold + 1: True,
+    }
+    for amplitude, expected in cases.items():
+        # 正负等幅样本的 RMS 即为 amplitude
+        data = struct.pack("<2h", amplitude, -amplitude)
+        assert recorder_module.Recorder._is_voiced(data) is expected
+    assert recorder_module.Recorder._is_voiced(b"") is False
+
+
+def test_segment_after_pause_keeps_trailing_silence(recorder_module):
+    rec = recorder_module.Recorder()
+    segments: list[bytes] = []
+    rec.start(on_segment=segments.append)
+
+    samples = recorder_module.CHUNK_SIZE
+    loud = b"\xe8\x03" * samples
+    quiet = b"\x00\x00" * samples
+    speech_chunks = recorder_module._MIN_SPEECH_CHUNKS + 1
+    pause = [quiet] * recorder_module._SILENCE_CHUNKS_NEEDED
+    for chunk in ([loud] * speech_chunks + pause) * 2:
+        rec._on_audio(chunk, samples, None, 0)
+    rec.stop()
+
+    # 第一段的尾部静音留作第二段的开头
+    assert segments == [
+        recorder_module.Recorder._build_wav(loud * speech_chunks),
+        recorder_module.Recorder._build_wav(b"".join(pause) + loud * speech_chunks),
+    ]
+
+
+def test_is_voiced_full_chunk_matches_threshold(recorder_module):
+    samples = recorder_module.CHUNK_SIZE
+    threshold = recorder_module.SILENCE_THRESHOLD
+    assert recorder_module.Recorder._is_voiced(struct.pack("<h", threshold) * samples) is True
+    assert recorder_module.Recorder._is_voiced(struct.pack("<h", threshold - 1) * samples) is False
+
+
+def test_full_recording_is_kept_only_without_segment_callback(recorder_module):
+    samples = recorder_module.CHUNK_SIZE
+    loud = b"\xe8\x03" * samples
+
+    rec = recorder_module.Recorder()
+    rec.start()
+    for _ in range(3):
+        rec._on_audio(loud, samples, None, 0)
+    assert rec.stop() == recorder_module.Recorder._build_wav(loud * 3)
+
+    rec.start(on_segment=lambda wav: None)
+    assert rec._frames is None
+    rec._on_audio(loud, samples, None, 0)
+    assert rec.stop() == recorder_module.Recorder._build_wav(loud)
+
+
+def test_leading_silence_is_trimmed_before_speech(recorder_module):
+    rec = recorder_module.Recorder()
+    segments: list[bytes] = []
+    rec.start(on_segment=segments.append)
+
+    samples = recorder_module.CHUNK_SIZE
+    loud = b"\xe8\x03" * samples
+    quiet = b"\x00\x00" * samples
+    pre_roll = recorder_module._SILENCE_CHUNKS_NEEDED
+    # 超过 MAX 时长的静音之后才开始说话，语音中夹带单个静音块的短暂间隙
+    leading = recorder_module._MAX_SEGMENT_CHUNKS + 10
+    speech = [loud] * 5 + [quiet] + [loud] * 5
+    for chunk in [quiet] * leading + speech + [quiet] * pre_roll:
+        rec._on_audio(chunk, samples, None, 0)
+    rec.stop()
+
+    # 开头静音只保留 pre-roll 部分，短暂间隙不会被当作 SOFT 时长后的停顿切开
+    assert segments == [recorder_module.Recorder._build_wav(quiet * pre_roll + b"".join(speech))]
@@ -108,3 +108,48 @@ def test_incremental_process_with_injected_dependencies(worker_module):
     assert history_calls
     assert history_calls[0][0][0] == "测试文本"
     assert history_calls[0][0][1] == "[测试文本]"
+
+
+def test_incremental_process_bounds_llm_context(worker_module, monkeypatch):
+    monkeypatch.setattr(worker_module, "_MAX_LLM_CONTEXT_CHARS", 5)
+    llm_contexts: list[str] = []
+
+    class FakeSTT:
+        def transcribe(self, audio, prompt=""):
+            return audio.decode()
+
+    class FakeLLM:
+        def refine(self, text, system_prompt="", context=""):
+            llm_contexts.append(context)
+            return text
+
+    w = worker_module.Worker(
+        AppConfig(),
+        recorder=object(),
+        stt_client_factory=lambda _cfg: FakeSTT(),
+        llm_client_factory=lambda _cfg: FakeLLM(),
+        text_injector=lambda _text: None,
+        history_adder=lambda *args, **kwargs: None,
+    )
+
+    q = Queue()
+    for segment in (b"abcdef", b"ghij", b"k"):
+        q.put(segment)
+    q.put((worker_module._SENTINEL, "10:00:00.000000"))
+
+    w._incremental_process("09:00:00.000000", q)
+
+    assert llm_contexts == ["", "bcdef", "fghij"]
+
+
+def test_now_hms_matches_strftime_format(worker_module, monkeypatch: pytest.MonkeyPatch) -> None:
+    from datetime import datetime
+
+    class _FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2026, 1, 2, 3, 4, 5)
+
+    monkeypatch.setattr(worker_module, "datetime", _FixedDatetime)
+    expected = _FixedDatetime.now().strftime("%H:%M:%S.%f")
+    assert worker_module._now_hms() == expected == "03:04:05.000000"